@@ -21,7 +21,8 @@ from models import RouteRequest, Coordinates, BoatType, BOAT_PROFILES
 from isochrone_router import generate_isochrone_routes
 from weather_fetcher import fetch_weather_for_waypoints
 from route_scorer import score_route
-from route_generator import calculate_distance  # , generate_routes
+from route_generator import calculate_distance, calculate_bearing  # , generate_routes
+from polars import is_in_no_go_zone, calculate_wind_angle
 
 # Set up logging - both to file and console
 # Use absolute path relative to project root (parent of backend/)
@@ -309,9 +310,6 @@ def calculate_routes():
             logger.info(f"      Checking {len(scored.waypoints)} waypoints for no-go zone violations...")
             for i, wp in enumerate(scored.waypoints[:-1]):  # All but last waypoint
                 if wp.weather:
-                    from route_generator import calculate_bearing
-                    from polars import is_in_no_go_zone, calculate_wind_angle
-                    
                     # To check the segment FROM waypoint[i] TO waypoint[i+1]:
                     # - First try the heading stored at waypoint[i+1] (represents the leg arriving at i+1)
                     # - Fall back to calculating bearing between waypoints
@@ -31,12 +31,14 @@ from dataclasses import dataclass, field
 
 from models import Coordinates, Waypoint, RouteRequest, BoatType, WaypointWeather
 from route_generator import (
-    calculate_distance, calculate_bearing, calculate_destination,
-    calculate_route_distance, format_duration, GeneratedRoute, RouteType
+    calculate_distance, calculate_distance_equirect, calculate_bearing, calculate_distance_and_bearing,
+    calculate_distances_to, calculate_destinations, calculate_route_distance, format_duration, GeneratedRoute, RouteType
 )
-from weather_fetcher import fetch_regional_weather_grid, interpolate_weather, calculate_forecast_hours_needed
-from polars import get_boat_speed, calculate_wind_angle, normalize_angle, is_in_no_go_zone
-from land_detector import is_land, is_close_to_land, DEFAULT_LAND_BUFFER_NM
+from weather_fetcher import (
+    fetch_regional_weather_grid, interpolate_weather, interpolate_weather_many, calculate_forecast_hours_needed
+)
+from polars import boat_speeds_for_headings, calculate_wind_angle, normalize_angle, has_no_go_zone, NO_GO_ANGLE
+from land_detector import is_land, is_land_many, is_close_to_land, DEFAULT_LAND_BUFFER_NM
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -46,7 +48,7 @@ logger = logging.getLogger(__name__)
 # DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)  # thousands are created per route: smaller and faster to build
 class IsochronePoint:
     """
     A point in space-time representing a reachable position at a specific time.
@@ -83,7 +85,7 @@ class IsochroneState:
     Tracks all points at current time level and history for pruning.
     """
     current_isochrone: List[IsochronePoint] = field(default_factory=list)
-    visited_grid: Dict[Tuple[int, int], float] = field(default_factory=dict)  # (lat_cell, lng_cell) -> best_time
+    visited_grid: Dict[int, float] = field(default_factory=dict)  # packed cell key (see get_grid_cell) -> best_time
     closest_distance_to_goal: float = float('inf')
     total_iterations: int = 0
 
@@ -124,20 +126,24 @@ ARRIVAL_THRESHOLD_NM = 2.0  # Consider "arrived" within 2nm (then add final segm
 # HELPER FUNCTIONS
 # ============================================================================
 
-def get_grid_cell(position: Coordinates, cell_size: float) -> Tuple[int, int]:
+def get_grid_cell(position: Coordinates, cell_size: float) -> int:
     """
-    Convert position to grid cell coordinates for pruning.
+    Convert position to a grid cell key for pruning.
+    
+    The (lat_cell, lng_cell) pair is packed into one int (lat_cell in the
+    high bits) so visited_grid lookups hash a plain int instead of building
+    and hashing a tuple. Distinct cells always get distinct keys.
     
     Args:
         position: Lat/lng coordinates
         cell_size: Size of grid cell in degrees
         
     Returns:
-        Tuple of (lat_cell, lng_cell) integers
+        Packed cell key: (lat_cell << 32) + lng_cell
     """
     lat_cell = int(position.lat / cell_size)
     lng_cell = int(position.lng / cell_size)
-    return (lat_cell, lng_cell)
+    return (lat_cell << 32) + lng_cell
 
 
 def get_adaptive_grid_cell_size(distance_to_goal: float, exploration_level: int = 0) -> float:
@@ -223,6 +229,41 @@ def is_in_directional_cone(
     return diff <= cone_half_angle
 
 
+def headings_in_directional_cone(
+    headings: range,
+    destination_bearing: float,
+    distance_to_goal: float,
+    cone_half_angle: float = DIRECTIONAL_CONE_ANGLE
+) -> List[int]:
+    """
+    Filter candidate headings to those inside the cone toward the destination.
+    
+    Same rule as is_in_directional_cone(), applied to a whole heading fan at
+    once so propagate_isochrone() doesn't make one call per heading.
+    
+    Args:
+        headings: Candidate headings in degrees
+        destination_bearing: Bearing to goal in degrees
+        distance_to_goal: Distance to goal in nautical miles
+        cone_half_angle: Half-angle of cone (degrees)
+        
+    Returns:
+        Headings within ±cone_half_angle of destination bearing (in input order)
+    """
+    # Near the goal (<10nm), allow all directions for final approach
+    if distance_to_goal < 10:
+        return list(headings)
+    
+    in_cone = []
+    for heading in headings:
+        diff = abs(heading - destination_bearing)
+        if diff > 180:
+            diff = 360 - diff
+        if diff <= cone_half_angle:
+            in_cone.append(heading)
+    return in_cone
+
+
 def should_prune_point(
     point: IsochronePoint,
     state: IsochroneState,
@@ -252,42 +293,17 @@ def should_prune_point(
     Returns:
         True if point should be pruned (discarded)
     """
-    # Strategy 0: Land detection - prune points on land immediately
-    # Boats can't sail on land, so these points are invalid
-    if is_land(point.position):
-        return True
-    
-    # Strategy 0.5: Close to land detection - prune points too close to coastlines
-    # Exception: Don't prune if point is close to start or end (it's normal to be near land there)
-    # Use a slightly larger threshold for "close to start/end" to be safe
-    START_END_EXCEPTION_DISTANCE_NM = 5.0  # Don't apply buffer within 5nm of start/end
-    
-    distance_to_start = calculate_distance(point.position, start) if start else float('inf')
-    distance_to_end = calculate_distance(point.position, destination)
-    
-    # Only check "close to land" if we're not near start or end
-    is_near_start_or_end = (distance_to_start < START_END_EXCEPTION_DISTANCE_NM or 
-                           distance_to_end < START_END_EXCEPTION_DISTANCE_NM)
-    
-    if not is_near_start_or_end:
-        # Check if point is too close to land (within buffer distance)
-        if is_close_to_land(point.position, buffer_distance_nm=DEFAULT_LAND_BUFFER_NM):
-            return True
+    # Pruning only compares distances against thresholds/each other, so the
+    # cheap equirectangular approximation is accurate enough here
+    distance_to_start = calculate_distance_equirect(point.position, start) if start else float('inf')
+    distance_to_end = calculate_distance_equirect(point.position, destination)
     
-    # Calculate distance to goal for adaptive strategies
-    distance_to_goal = calculate_distance(point.position, destination)
-    
-    # Strategy 1: Grid-based pruning (adaptive grid size)
-    cell_size = get_adaptive_grid_cell_size(distance_to_goal, len(state.visited_grid))
-    cell = get_grid_cell(point.position, cell_size)
-    
-    # Update closest distance if this is better (for logging and distance-based pruning)
-    if distance_to_goal < state.closest_distance_to_goal:
-        state.closest_distance_to_goal = distance_to_goal
+    # Distance to goal for adaptive strategies (same value as distance_to_end)
+    distance_to_goal = distance_to_end
+    exploration_level = len(state.visited_grid)
     
-    # Strategy 2: Distance-based pruning (check first, before grid-based)
+    # Strategy 2: Distance-based pruning (cheap, so checked before the land lookups)
     # Apply aggressively from the start to achieve ~90% pruning consistently
-    exploration_level = len(state.visited_grid)
     distance_threshold = route_distance * 0.5  # 50% of route distance (halfway point)
     
     # Enable distance-based pruning from the very start for consistent 90% pruning
@@ -308,16 +324,46 @@ def should_prune_point(
     # - We're still far from goal (>50% of route distance remaining), OR
     # - We're well-explored (exploration_level > 10)
     # This ensures aggressive pruning from the start
+    # (A point pruned here is farther than the closest distance, so it could
+    # never have updated state.closest_distance_to_goal - checking before the
+    # land tests and the update below gives the same result.)
     if state.closest_distance_to_goal > distance_threshold or exploration_level > 10:
         if state.closest_distance_to_goal > 0:  # Only if we have a valid closest distance
             if distance_to_goal > state.closest_distance_to_goal * distance_multiplier:
                 return True
     
+    # Strategy 0: Land detection - prune points on land immediately
+    # Boats can't sail on land, so these points are invalid
+    if is_land(point.position):
+        return True
+    
+    # Strategy 0.5: Close to land detection - prune points too close to coastlines
+    # Exception: Don't prune if point is close to start or end (it's normal to be near land there)
+    # Use a slightly larger threshold for "close to start/end" to be safe
+    START_END_EXCEPTION_DISTANCE_NM = 5.0  # Don't apply buffer within 5nm of start/end
+    
+    # Only check "close to land" if we're not near start or end
+    is_near_start_or_end = (distance_to_start < START_END_EXCEPTION_DISTANCE_NM or 
+                           distance_to_end < START_END_EXCEPTION_DISTANCE_NM)
+    
+    if not is_near_start_or_end:
+        # Check if point is too close to land (within buffer distance)
+        if is_close_to_land(point.position, buffer_distance_nm=DEFAULT_LAND_BUFFER_NM):
+            return True
+    
+    # Strategy 1: Grid-based pruning (adaptive grid size)
+    cell_size = get_adaptive_grid_cell_size(distance_to_goal, exploration_level)
+    cell = get_grid_cell(point.position, cell_size)
+    
+    # Update closest distance if this is better (for logging and distance-based pruning)
+    if distance_to_goal < state.closest_distance_to_goal:
+        state.closest_distance_to_goal = distance_to_goal
+    
     # Strategy 1: Grid-based pruning (adaptive grid size)
     # Check if we've been to this grid cell before
-    if cell in state.visited_grid:
-        previous_best_time = state.visited_grid[cell]
-        
+    # Single dict lookup (no separate membership test); stored times are never None
+    previous_best_time = state.visited_grid.get(cell)
+    if previous_best_time is not None:
         # Calculate time difference
         time_diff = point.time_hours - previous_best_time
         
@@ -396,8 +442,8 @@ def should_prune_point(
         neighbor_cell = get_grid_cell(point.position, neighbor_cell_size)
         
         # If we've been to a nearby (larger) cell, compare times
-        if neighbor_cell in state.visited_grid:
-            nearby_best_time = state.visited_grid[neighbor_cell]
+        nearby_best_time = state.visited_grid.get(neighbor_cell)
+        if nearby_best_time is not None:
             time_diff = point.time_hours - nearby_best_time
             
             # Be more lenient for nearby cells (they're not exactly the same location)
@@ -586,59 +632,74 @@ def propagate_isochrone(
         'added': 0
     }
     
+    # Sailboats/catamarans can't point closer than NO_GO_ANGLE; motorboats can
+    sail_no_go = has_no_go_zone(boat_type)
+    
     for point in current_isochrone:
-        # Calculate bearing to destination (for directional focusing)
-        destination_bearing = calculate_bearing(point.position, destination)
-        
-        # Calculate distance to goal (for adaptive parameters)
-        distance_to_goal = calculate_distance(point.position, destination)
+        # Distance to goal (for adaptive parameters) and bearing to destination
+        # (for directional focusing), sharing the trig between the two
+        distance_to_goal, destination_bearing = calculate_distance_and_bearing(point.position, destination)
         
         # Get angular step size (finer resolution near goal)
         angular_step = get_angular_step(distance_to_goal)
         
         # Try multiple headings
-        for heading in range(0, 360, angular_step):
-            state.total_iterations += 1
-            debug_counters['total_headings_tried'] += 1
-            
-            # Optimization 1: Skip headings outside directional cone
-            if not is_in_directional_cone(heading, destination_bearing, distance_to_goal):
-                debug_counters['skipped_cone'] += 1
-                continue
-            
-            # First, estimate where we'd end up with this heading (for initial boat speed calculation)
-            # We need an initial boat_speed estimate, so use weather at current position
-            current_time = departure_time + timedelta(hours=point.time_hours)
-            current_weather = interpolate_weather(point.position, current_time, weather_grid)
-            
-            if current_weather is None:
-                continue  # No weather data available
-            
-            # Calculate wind angle for this heading using current weather
-            wind_angle = calculate_wind_angle(heading, current_weather.wind_direction)
-            
-            # Get boat speed from polar diagram
-            boat_speed = get_boat_speed(current_weather.wind_speed, wind_angle, boat_type)
-            
-            if boat_speed <= 0:
-                debug_counters['skipped_zero_speed'] += 1
-                continue  # Can't make progress in this direction
-            
-            # Calculate distance traveled in this time step
-            distance_nm = boat_speed * time_step_hours
-            
-            # Calculate new position
-            new_position = calculate_destination(point.position, distance_nm, heading)
-            
-            # Optimization 0: Skip land positions (boats can't sail on land)
-            if is_land(new_position):
-                debug_counters['skipped_land'] += 1
-                continue
-            
-            # Now get weather at the DESTINATION position and time (where we'll arrive)
-            arrival_time = departure_time + timedelta(hours=point.time_hours + time_step_hours)
-            destination_weather = interpolate_weather(new_position, arrival_time, weather_grid)
-            
+        headings = range(0, 360, angular_step)
+        state.total_iterations += len(headings)
+        debug_counters['total_headings_tried'] += len(headings)
+        
+        # Optimization 1: Skip headings outside directional cone
+        cone_headings = headings_in_directional_cone(headings, destination_bearing, distance_to_goal)
+        debug_counters['skipped_cone'] += len(headings) - len(cone_headings)
+        
+        if not cone_headings:
+            continue
+        
+        # First, estimate where we'd end up with each heading (for initial boat speed calculation)
+        # We need an initial boat_speed estimate, so use weather at current position
+        current_time = departure_time + timedelta(hours=point.time_hours)
+        current_weather = interpolate_weather(point.position, current_time, weather_grid)
+        
+        if current_weather is None:
+            continue  # No weather data available
+        
+        # Boat speeds from polar diagram for all headings using current weather
+        boat_speeds = boat_speeds_for_headings(
+            cone_headings, current_weather.wind_direction, current_weather.wind_speed, boat_type
+        )
+        
+        # Drop headings where we can't make progress (zero speed)
+        moving = [(heading, boat_speed) for heading, boat_speed in zip(cone_headings, boat_speeds)
+                  if boat_speed > 0]
+        debug_counters['skipped_zero_speed'] += len(cone_headings) - len(moving)
+        
+        # Distance traveled in this time step and resulting positions for the whole fan
+        distances_nm = [boat_speed * time_step_hours for _, boat_speed in moving]
+        new_positions = calculate_destinations(
+            point.position, distances_nm, [heading for heading, _ in moving]
+        )
+        
+        # Optimization 0: Skip land positions (boats can't sail on land)
+        on_land = is_land_many(new_positions)
+        candidates = [
+            (heading, boat_speed, distance_nm, new_position)
+            for (heading, boat_speed), distance_nm, new_position, land in zip(
+                moving, distances_nm, new_positions, on_land
+            )
+            if not land
+        ]
+        debug_counters['skipped_land'] += len(moving) - len(candidates)
+        
+        # Now get weather at each DESTINATION position (where we'll arrive) -
+        # all children of this point arrive at the same time
+        arrival_time = departure_time + timedelta(hours=point.time_hours + time_step_hours)
+        destination_weathers = interpolate_weather_many(
+            [new_position for _, _, _, new_position in candidates], arrival_time, weather_grid
+        )
+        
+        for (heading, boat_speed, distance_nm, new_position), destination_weather in zip(
+            candidates, destination_weathers
+        ):
             if destination_weather is None:
                 continue  # No weather data at destination
             
@@ -648,7 +709,7 @@ def propagate_isochrone(
             # Optimization 2: Skip no-go zone (boat speed = 0)
             # For sailboats/catamarans, wind angles < 45° are impossible
             # Check the DESTINATION weather, not the current weather
-            if is_in_no_go_zone(destination_wind_angle, boat_type):
+            if sail_no_go and destination_wind_angle < NO_GO_ANGLE:
                 debug_counters['skipped_no_go'] += 1
                 continue
             
@@ -702,9 +763,10 @@ def propagate_isochrone(
     # Log pruning effectiveness and land detection
     if debug_counters['pruned'] > 0 or debug_counters['skipped_land'] > 0:
         prune_ratio = debug_counters['pruned'] / (debug_counters['pruned'] + debug_counters['added']) if (debug_counters['pruned'] + debug_counters['added']) > 0 else 0
-        logger.debug(f"  Pruning: {debug_counters['pruned']} pruned, {debug_counters['added']} added ({prune_ratio*100:.1f}% pruned)")
+        logger.debug("  Pruning: %d pruned, %d added (%.1f%% pruned)",
+                     debug_counters['pruned'], debug_counters['added'], prune_ratio * 100)
         if debug_counters['skipped_land'] > 0:
-            logger.debug(f"  Land detection: {debug_counters['skipped_land']} points skipped (on land)")
+            logger.debug("  Land detection: %d points skipped (on land)", debug_counters['skipped_land'])
     
     # Always favor points closer to goal by sorting and limiting isochrone size
     if len(next_isochrone) > MAX_ISOCHRONE_GROWTH_WARNING:
@@ -726,7 +788,9 @@ def propagate_isochrone(
             pass
         else:
             reduction_ratio = len(next_isochrone) / target_size
-            logger.info(f"  Isochrone pruning: {len(next_isochrone)} → {target_size} points ({reduction_ratio:.1f}x reduction, {((1 - target_size/len(next_isochrone))*100):.1f}% pruned)")
+            logger.info("  Isochrone pruning: %d → %d points (%.1fx reduction, %.1f%% pruned)",
+                        len(next_isochrone), target_size, reduction_ratio,
+                        (1 - target_size / len(next_isochrone)) * 100)
             
             # Smarter selection: Use a combination of distance and time efficiency
             # This keeps points that are either:
@@ -737,7 +801,7 @@ def propagate_isochrone(
             # Calculate a combined score: lower is better
             # Score = normalized_distance + normalized_time
             # Normalize both to 0-1 range so they're comparable
-            distances = [calculate_distance(p.position, destination) for p in next_isochrone]
+            distances = calculate_distances_to([p.position for p in next_isochrone], destination)
             times = [p.time_hours for p in next_isochrone]
             
             min_dist = min(distances)
@@ -791,9 +855,9 @@ def find_arrival_point(
         The point that arrived (closest to destination if multiple), or None
     """
     arrived_points = []
+    distances = calculate_distances_to([point.position for point in isochrone], destination)
     
-    for point in isochrone:
-        distance = calculate_distance(point.position, destination)
+    for point, distance in zip(isochrone, distances):
         if distance <= threshold_nm:
             arrived_points.append((distance, point))
     
@@ -851,7 +915,11 @@ def calculate_isochrone_route(
     # Initialize first isochrone with just the start point
     state.current_isochrone = [start_point]
     route_distance = calculate_distance(request.start, request.end)
-    state.closest_distance_to_goal = route_distance
+    # should_prune_point measures, compares and updates distances with the
+    # equirectangular approximation, so its inputs use the same metric
+    # (Haversine route_distance is only reported)
+    pruning_route_distance = calculate_distance_equirect(request.start, request.end)
+    state.closest_distance_to_goal = pruning_route_distance
     
     logger.info(f"Initial distance to goal: {route_distance:.1f} nm")
     
@@ -896,10 +964,12 @@ def calculate_isochrone_route(
         distance_to_goal = state.closest_distance_to_goal
         time_step = get_adaptive_time_step(distance_to_goal)
         
-        logger.info(f"Time: {current_time_hours:.1f}h | Isochrone: {len(state.current_isochrone)} pts | Closest: {distance_to_goal:.1f}nm | Step: {time_step:.1f}h | Visited cells: {len(state.visited_grid)}")
+        logger.info("Time: %.1fh | Isochrone: %d pts | Closest: %.1fnm | Step: %.1fh | Visited cells: %d",
+                    current_time_hours, len(state.current_isochrone), distance_to_goal,
+                    time_step, len(state.visited_grid))
         
         # Propagate isochrone forward
-        logger.debug(f"Before propagation: {len(state.current_isochrone)} points")
+        logger.debug("Before propagation: %d points", len(state.current_isochrone))
         state.current_isochrone = propagate_isochrone(
             current_isochrone=state.current_isochrone,
             destination=request.end,
@@ -908,7 +978,7 @@ def calculate_isochrone_route(
             time_step_hours=time_step,
             departure_time=departure_time,
             state=state,
-            route_distance=route_distance,
+            route_distance=pruning_route_distance,
             start=request.start
         )
         
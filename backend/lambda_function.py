@@ -13,7 +13,7 @@ from models import RouteRequest, Coordinates, BoatType
 from route_generator import generate_routes, calculate_distance
 from isochrone_router import generate_isochrone_routes
 from weather_fetcher import fetch_weather_for_waypoints
-from route_scorer import score_route
+from route_scorer import score_routes
 
 # Set up logging (Lambda logs to CloudWatch)
 logger = logging.getLogger()
@@ -136,14 +136,8 @@ def lambda_handler(event, context):
             route.waypoints = waypoints_with_weather
             routes_with_weather.append(route)
         
-        # Step 3: Score each route
-        scored_routes = []
-        for route in routes_with_weather:
-            scored = score_route(route, request.boat_type, direct_distance)
-            scored_routes.append(scored)
-        
-        # Sort by score (highest first)
-        scored_routes.sort(key=lambda r: r.score, reverse=True)
+        # Step 3: Score each route (sorted by score, highest first)
+        scored_routes = score_routes(routes_with_weather, request.boat_type, direct_distance)
         
         # Build response
         response_body = {
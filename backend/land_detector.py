@@ -9,7 +9,7 @@ This allows offline land/water detection without requiring external API calls.
 
 import logging
 import math
-from typing import Optional
+from typing import List, Optional
 
 try:
     from global_land_mask import globe
@@ -19,7 +19,7 @@ except ImportError:
     globe = None
 
 from models import Coordinates
-from route_generator import calculate_destination
+from route_generator import calculate_destinations
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -58,6 +58,34 @@ def is_land(position: Coordinates) -> bool:
         return False  # Graceful fallback: assume water on error
 
 
+def is_land_many(positions: List[Coordinates]) -> List[bool]:
+    """
+    Check a batch of positions for land with a single mask lookup.
+    
+    Same answers as calling is_land() per position, but global-land-mask is
+    called once with coordinate lists instead of once per point.
+    
+    Args:
+        positions: Coordinates to check
+        
+    Returns:
+        List of booleans (True = on land), one per position.
+        All False if land detection is not available (graceful fallback).
+    """
+    if not LAND_DETECTION_AVAILABLE or not positions:
+        return [is_land(position) for position in positions]
+    
+    try:
+        return globe.is_land(
+            [position.lat for position in positions],
+            [position.lng for position in positions]
+        ).tolist()
+    except Exception:
+        # One bad coordinate fails the whole batch - fall back to per-point
+        # checks so only that point is treated as water
+        return [is_land(position) for position in positions]
+
+
 def is_water(position: Coordinates) -> bool:
     """
     Check if a geographic position is on water.
@@ -107,22 +135,14 @@ def is_close_to_land(
     # Sample points around the position in a circle
     # We check points at the buffer distance radius
     angle_step = 360.0 / sample_points
-    
-    for i in range(sample_points):
-        # Calculate bearing for this sample point
-        bearing = i * angle_step
-        
-        # Calculate position at buffer distance in this direction
-        sample_position = calculate_destination(position, buffer_distance_nm, bearing)
-        
-        # If any sample point is on land, the center is too close to land
-        if is_land(sample_position):
-            return True
+    bearings = [i * angle_step for i in range(sample_points)]
+    sample_positions = calculate_destinations(
+        position, [buffer_distance_nm] * sample_points, bearings
+    )
     
     # Also check the center point itself (shouldn't be on land, but good to verify)
-    if is_land(position):
-        return True
+    sample_positions.append(position)
     
-    # None of the sampled points or center are on land
-    return False
+    # If any sampled point or the center is on land, the position is too close to land
+    return any(is_land_many(sample_positions))
 
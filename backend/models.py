@@ -22,7 +22,7 @@ class RouteType(Enum):
     STARBOARD = "starboard"  # Right side of direct route
 
 
-@dataclass
+@dataclass(slots=True)  # created for every candidate position in routing
 class Coordinates:
     """A point on Earth (latitude/longitude)"""
     lat: float  # Latitude (-90 to 90)
@@ -43,7 +43,7 @@ class WaypointWeather:
     is_estimated: bool = False    # True if API failed and defaults were used
 
 
-@dataclass
+@dataclass(slots=True)  # one per route point, weather attached in place
 class Waypoint:
     """A point along the route with arrival time and weather"""
     position: Coordinates
@@ -14,7 +14,8 @@ Key Concepts:
 
 import math
 import logging
-from typing import Dict, Tuple, Optional
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Tuple, Optional
 from enum import Enum
 
 # Set up logging
@@ -335,6 +336,25 @@ POLARS: Dict[BoatType, Dict[int, Dict[int, float]]] = {
     BoatType.MOTORBOAT: MOTORBOAT_POLAR,
 }
 
+# Same tables keyed by the plain string value ('sailboat', ...), each with its
+# sorted wind speed and wind angle axes. Callers pass boat types as strings, so
+# hot lookups skip constructing a BoatType enum, and get_boat_speed() doesn't
+# re-sort the axes on every call.
+_POLAR_TABLES: Dict[str, Tuple[Dict[int, Dict[int, float]], List[int], List[int]]] = {
+    boat_type.value: (
+        polar,
+        sorted(polar),
+        sorted(polar[min(polar)])  # All wind speeds have same angles
+    )
+    for boat_type, polar in POLARS.items()
+}
+
+_MOTORBOAT = BoatType.MOTORBOAT.value
+
+# Sailboats and catamarans cannot sail closer than this to the wind. Both
+# sail polars are 0 for every angle up to and including this one.
+NO_GO_ANGLE = 45
+
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -375,15 +395,14 @@ def calculate_wind_angle(boat_heading: float, wind_direction: float) -> float:
         - Boat heading 090° (East), Wind from 270° (West) → TWA = 180° (dead downwind)
         - Boat heading 000° (North), Wind from 045° (NE) → TWA = 45° (close-hauled)
     """
-    # Calculate relative angle
-    relative = abs(boat_heading - wind_direction)
-    relative = normalize_angle(relative)
-    
-    # Mirror to 0-180° range (polars are symmetric)
-    if relative > 180:
-        relative = 360 - relative
-    
-    return relative
+    # Relative angle folded into 0-360°, then mirrored to 0-180° (polars are
+    # symmetric). Closed form: no normalize_angle loop, no mirror branch.
+    # Inputs are normally already 0-360°, so only reduce when needed - the
+    # float modulo is the slowest part of this function.
+    diff = abs(boat_heading - wind_direction)
+    if diff >= 360.0:
+        diff %= 360.0
+    return 180.0 - abs(diff - 180.0)
 
 
 def bilinear_interpolate(
@@ -437,6 +456,82 @@ def bilinear_interpolate(
 # MAIN POLAR FUNCTIONS
 # ============================================================================
 
+def speed_for_angle_fn(wind_speed: float, boat_type: str) -> Callable[[float], float]:
+    """
+    Specialize the polar lookup for one boat type and wind speed.
+    
+    Resolves the polar table and the bounding wind speeds once, so callers
+    that evaluate many wind angles under the same wind only pay for the
+    angle lookup and interpolation per call.
+    
+    Args:
+        wind_speed: True wind speed in knots
+        boat_type: Type of boat ('sailboat', 'motorboat', 'catamaran')
+    
+    Returns:
+        Function mapping a true wind angle (degrees) to boat speed in knots,
+        matching get_boat_speed(wind_speed, wind_angle, boat_type)
+    """
+    # Validate inputs
+    if wind_speed < 0:
+        return lambda wind_angle: 0.0
+    
+    # Get polar table and its sorted axes for boat type
+    # (exact match first, then case-insensitive)
+    table = _POLAR_TABLES.get(boat_type)
+    if table is None:
+        # Unknown boat type, default to sailboat
+        table = _POLAR_TABLES.get(boat_type.lower(), _POLAR_TABLES[BoatType.SAILBOAT.value])
+    polar, wind_speeds, wind_angles = table
+    
+    # Handle out-of-range wind speeds
+    if wind_speed <= wind_speeds[0]:
+        # Below minimum wind speed - use lowest available
+        ws_low = ws_high = wind_speeds[0]
+    elif wind_speed >= wind_speeds[-1]:
+        # Above maximum wind speed - use highest available
+        ws_low = ws_high = wind_speeds[-1]
+    else:
+        # Find bounding wind speeds (binary search; an exact match on a
+        # tabulated speed brackets as (previous, match))
+        i = bisect_left(wind_speeds, wind_speed)
+        ws_low = wind_speeds[i - 1]
+        ws_high = wind_speeds[i]
+    
+    row_low = polar[ws_low]
+    row_high = polar[ws_high]
+    min_angle = wind_angles[0]
+    max_angle = wind_angles[-1]
+    
+    def speed_for_angle(wind_angle: float) -> float:
+        # Normalize wind angle to 0-180
+        wind_angle = abs(wind_angle)
+        if wind_angle > 180:
+            wind_angle = 360 - wind_angle
+        
+        # Handle out-of-range wind angles
+        if wind_angle <= min_angle:
+            wa_low = wa_high = min_angle
+        elif wind_angle >= max_angle:
+            wa_low = wa_high = max_angle
+        else:
+            # Find bounding wind angles
+            i = bisect_left(wind_angles, wind_angle)
+            wa_low = wind_angles[i - 1]
+            wa_high = wind_angles[i]
+        
+        # Perform bilinear interpolation over the four corners
+        # (handles all cases: exact match, linear, bilinear)
+        return bilinear_interpolate(
+            wind_speed, wind_angle,
+            ws_low, ws_high,
+            wa_low, wa_high,
+            row_low[wa_low], row_low[wa_high], row_high[wa_low], row_high[wa_high]
+        )
+    
+    return speed_for_angle
+
+
 def get_boat_speed(
     wind_speed: float,
     wind_angle: float,
@@ -465,72 +560,52 @@ def get_boat_speed(
         >>> get_boat_speed(12, 95, 'sailboat')
         7.4  # Interpolated between 10 and 15 knots, 90 and 110 degrees
     """
-    # Validate inputs
-    if wind_speed < 0:
-        return 0.0
-    
-    # Normalize wind angle to 0-180
-    wind_angle = abs(wind_angle)
-    if wind_angle > 180:
-        wind_angle = 360 - wind_angle
-    
-    # Get polar table for boat type
-    try:
-        boat_type_enum = BoatType(boat_type.lower())
-        polar = POLARS[boat_type_enum]
-    except (ValueError, KeyError):
-        # Unknown boat type, default to sailboat
-        polar = POLARS[BoatType.SAILBOAT]
+    return speed_for_angle_fn(wind_speed, boat_type)(wind_angle)
+
+
+def boat_speeds_for_headings(
+    headings: Iterable[float],
+    wind_direction: float,
+    wind_speed: float,
+    boat_type: str
+) -> List[float]:
+    """
+    Get boat speeds for a fan of headings under the same wind.
     
-    # Get available wind speeds and angles from polar table
-    wind_speeds = sorted(polar.keys())
-    wind_angles = sorted(polar[wind_speeds[0]].keys())  # All wind speeds have same angles
+    Fuses calculate_wind_angle() and get_boat_speed() so callers that try
+    many headings from one position make a single call.
     
-    # Handle out-of-range wind speeds
-    if wind_speed <= wind_speeds[0]:
-        # Below minimum wind speed - use lowest available
-        ws_low = ws_high = wind_speeds[0]
-    elif wind_speed >= wind_speeds[-1]:
-        # Above maximum wind speed - use highest available
-        ws_low = ws_high = wind_speeds[-1]
-    else:
-        # Find bounding wind speeds
-        ws_low = wind_speeds[0]
-        ws_high = wind_speeds[-1]
-        for i in range(len(wind_speeds) - 1):
-            if wind_speeds[i] <= wind_speed <= wind_speeds[i + 1]:
-                ws_low = wind_speeds[i]
-                ws_high = wind_speeds[i + 1]
-                break
-    
-    # Handle out-of-range wind angles
-    if wind_angle <= wind_angles[0]:
-        wa_low = wa_high = wind_angles[0]
-    elif wind_angle >= wind_angles[-1]:
-        wa_low = wa_high = wind_angles[-1]
-    else:
-        # Find bounding wind angles
-        wa_low = wind_angles[0]
-        wa_high = wind_angles[-1]
-        for i in range(len(wind_angles) - 1):
-            if wind_angles[i] <= wind_angle <= wind_angles[i + 1]:
-                wa_low = wind_angles[i]
-                wa_high = wind_angles[i + 1]
-                break
-    
-    # Get boat speeds at four corners of interpolation grid
-    q11 = polar[ws_low][wa_low]    # Lower-left
-    q12 = polar[ws_low][wa_high]   # Upper-left
-    q21 = polar[ws_high][wa_low]   # Lower-right
-    q22 = polar[ws_high][wa_high]  # Upper-right
-    
-    # Perform bilinear interpolation (handles all cases: exact match, linear, bilinear)
-    return bilinear_interpolate(
-        wind_speed, wind_angle,
-        ws_low, ws_high,
-        wa_low, wa_high,
-        q11, q12, q21, q22
-    )
+    Args:
+        headings: Boat headings in degrees (0-360°)
+        wind_direction: Direction wind is coming FROM (0-360°)
+        wind_speed: True wind speed in knots
+        boat_type: Type of boat ('sailboat', 'motorboat', 'catamaran')
+    
+    Returns:
+        Boat speed in knots for each heading, in input order
+    """
+    speed_for_angle = speed_for_angle_fn(wind_speed, boat_type)
+    
+    if boat_type == _MOTORBOAT or boat_type.lower() == _MOTORBOAT:
+        return [
+            speed_for_angle(calculate_wind_angle(heading, wind_direction))
+            for heading in headings
+        ]
+    
+    # Sail types: no-go headings are 0 in the polar, so skip the interpolation.
+    # Wind direction is fixed for the whole fan, so calculate_wind_angle() is
+    # inlined here (same arithmetic) rather than called per heading.
+    speeds = []
+    for heading in headings:
+        diff = abs(heading - wind_direction)
+        if diff >= 360.0:
+            diff %= 360.0
+        wind_angle = 180.0 - abs(diff - 180.0)
+        if wind_angle < NO_GO_ANGLE:
+            speeds.append(0.0)
+        else:
+            speeds.append(speed_for_angle(wind_angle))
+    return speeds
 
 
 def get_optimal_vmg_angle(
@@ -567,13 +642,10 @@ def get_optimal_vmg_angle(
     best_heading = destination_bearing
     max_vmg = 0.0
     
-    for heading in range(0, 360, 5):
-        # Calculate wind angle for this heading
-        twa = calculate_wind_angle(heading, wind_direction)
-        
-        # Get boat speed at this heading
-        boat_speed = get_boat_speed(wind_speed, twa, boat_type)
-        
+    headings = range(0, 360, 5)
+    boat_speeds = boat_speeds_for_headings(headings, wind_direction, wind_speed, boat_type)
+    
+    for heading, boat_speed in zip(headings, boat_speeds):
         if boat_speed == 0:
             continue  # In no-go zone
         
@@ -613,6 +685,23 @@ def calculate_vmg(
     return boat_speed * math.cos(math.radians(angle_off))
 
 
+def has_no_go_zone(boat_type: str) -> bool:
+    """
+    Check if a boat type has a no-go zone at all.
+    
+    Lets callers that test many wind angles for one boat resolve the boat
+    type once and then compare angles against NO_GO_ANGLE directly.
+    
+    Args:
+        boat_type: Type of boat
+    
+    Returns:
+        True for sail types (sailboat, catamaran), False for motorboats
+    """
+    # Motorboats have no restrictions
+    return not (boat_type == _MOTORBOAT or boat_type.lower() == _MOTORBOAT)
+
+
 def is_in_no_go_zone(wind_angle: float, boat_type: str) -> bool:
     """
     Check if wind angle is in the no-go zone for given boat type.
@@ -624,12 +713,11 @@ def is_in_no_go_zone(wind_angle: float, boat_type: str) -> bool:
     Returns:
         True if in no-go zone (cannot sail this angle)
     """
-    # Motorboats have no restrictions
-    if boat_type.lower() == BoatType.MOTORBOAT.value:
+    if not has_no_go_zone(boat_type):
         return False
     
     # Sailboats and catamarans cannot sail < 45° to wind
-    return abs(wind_angle) < 45
+    return abs(wind_angle) < NO_GO_ANGLE
 
 
 # ============================================================================
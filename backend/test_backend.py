@@ -7,6 +7,7 @@ Tests cover:
 - Pruning and progress detection
 - Grid-based optimization
 - Boat speed calculations
+- Route scoring
 """
 
 import logging
@@ -19,8 +20,14 @@ from isochrone_router import (
     get_grid_cell, GRID_CELL_SIZE, is_in_directional_cone,
     calculate_isochrone_route
 )
-from route_generator import calculate_distance, calculate_destination
-from polars import get_boat_speed, calculate_wind_angle
+from route_generator import (
+    calculate_distance, calculate_distance_equirect, calculate_distances_to,
+    calculate_bearing, calculate_distance_and_bearing, calculate_destination, calculate_destinations,
+    parse_departure_time, generate_routes, recalculate_route_times_with_wind
+)
+from route_scorer import score_routes
+from weather_fetcher import interpolate_weather, interpolate_weather_many
+from polars import get_boat_speed, calculate_wind_angle, boat_speeds_for_headings
 
 logger = logging.getLogger(__name__)
 
@@ -39,30 +46,30 @@ def create_mock_weather_grid(start, end, wind_direction=0.0):
     lat_step = (max_lat - min_lat) / 2
     lng_step = (max_lng - min_lng) / 2
     
-    # Create grid points
-    grid_points = []
-    for i in range(3):
-        for j in range(3):
-            lat = min_lat + i * lat_step
-            lng = min_lng + j * lng_step
-            grid_points.append((lat, lng))
+    # Create grid points (3x3, row-major by latitude)
+    grid_points = [
+        (min_lat + i * lat_step, min_lng + j * lng_step)
+        for i in range(3)
+        for j in range(3)
+    ]
     
     # Create times list
     base_time = datetime.now(timezone.utc)
     times = [base_time + timedelta(hours=h) for h in range(24)]
     
     # Create weather data dict: (lat, lng, time_index) -> WaypointWeather
-    weather_data = {}
-    for lat, lng in grid_points:
-        for time_idx in range(len(times)):
-            weather_data[(lat, lng, time_idx)] = WaypointWeather(
-                wind_speed=15.0,
-                wind_direction=wind_direction,
-                wave_height=1.0,
-                visibility=10.0,
-                precipitation=0.0,
-                temperature=20.0
-            )
+    weather_data = {
+        (lat, lng, time_idx): WaypointWeather(
+            wind_speed=15.0,
+            wind_direction=wind_direction,
+            wave_height=1.0,
+            visibility=10.0,
+            precipitation=0.0,
+            temperature=20.0
+        )
+        for lat, lng in grid_points
+        for time_idx in range(len(times))
+    }
     
     return {
         'grid_points': grid_points,
@@ -143,6 +150,22 @@ def test_beam_reach_isochrone():
         logger.info(f"Route has {len(route.waypoints)} waypoints")
 
 
+def test_interpolate_weather_many_matches_single():
+    """Test batched weather interpolation matches per-position interpolation"""
+    start = Coordinates(lat=36.0, lng=-5.0)
+    end = Coordinates(lat=37.0, lng=-4.0)
+    weather_grid = create_mock_weather_grid(start, end, wind_direction=90.0)
+    # Vary wind over time so temporal interpolation matters
+    for (lat, lng, time_idx), weather in weather_grid['weather_data'].items():
+        weather.wind_direction = (90.0 + 10 * time_idx + lat) % 360
+        weather.wind_speed = 10.0 + time_idx + lng / 10
+    
+    time = weather_grid['times'][3] + timedelta(minutes=20)
+    positions = [Coordinates(lat=36.0 + i * 0.2, lng=-5.0 + i * 0.15) for i in range(6)]
+    batched = interpolate_weather_many(positions, time, weather_grid)
+    assert batched == [interpolate_weather(p, time, weather_grid) for p in positions]
+
+
 # ============================================================================
 # DIRECTIONAL CONE TESTS
 # ============================================================================
@@ -490,6 +513,15 @@ def test_boat_speed_no_go_zone():
     assert speed == 0, "Boat should not move in no-go zone"
 
 
+def test_boat_speeds_for_headings_matches_scalar():
+    """Test batched heading speeds match per-heading polar lookups"""
+    headings = range(0, 360, 15)
+    for boat_type in ('sailboat', 'catamaran', 'motorboat'):
+        speeds = boat_speeds_for_headings(headings, 30.0, 12.0, boat_type)
+        expected = [get_boat_speed(12.0, calculate_wind_angle(h, 30.0), boat_type) for h in headings]
+        assert speeds == expected, f"Batched speeds differ for {boat_type}"
+
+
 def test_wind_angle_calculation():
     """Test wind angle calculation"""
     # Boat heading north (0°), wind from north (0°) = 0° wind angle (headwind)
@@ -506,3 +538,148 @@ def test_wind_angle_calculation():
     
     logger.info(f"Wind angle tests passed: headwind={angle1}°, tailwind={angle2}°, beam={angle3}°")
 
+
+
+# ============================================================================
+# ROUTE GENERATOR TESTS
+# ============================================================================
+
+def test_parse_departure_time_accepts_z_suffix():
+    """Test that 'Z' and '+00:00' departure strings parse to the same instant"""
+    zulu = parse_departure_time("2024-01-15T10:00:00Z")
+    offset = parse_departure_time("2024-01-15T10:00:00+00:00")
+    
+    assert zulu == offset, "'Z' suffix should be treated as UTC"
+    assert zulu.tzinfo is not None, "Parsed departure should be timezone-aware"
+
+
+def test_distances_to_matches_single_distance():
+    """Test batched distances to a shared end match calculate_distance"""
+    end = Coordinates(lat=38.5, lng=1.0)
+    positions = [Coordinates(lat=36.0 + i * 0.4, lng=-5.0 + i * 0.9) for i in range(8)] + [end]
+    assert calculate_distances_to(positions, end) == [calculate_distance(p, end) for p in positions]
+
+
+def test_distance_equirect_close_to_haversine():
+    """Test that the pruning distance approximation stays within 1% of Haversine"""
+    start = Coordinates(lat=36.0, lng=-5.0)
+    for end in (Coordinates(lat=38.5, lng=1.0), Coordinates(lat=36.1, lng=-4.9),
+                Coordinates(lat=40.0, lng=-5.0)):
+        exact = calculate_distance(start, end)
+        assert abs(calculate_distance_equirect(start, end) - exact) < exact * 0.01
+
+
+def test_distance_equirect_across_dateline():
+    """Test that the pruning distance takes the short way across the antimeridian"""
+    for start, end in (
+        (Coordinates(lat=0.0, lng=179.5), Coordinates(lat=0.0, lng=-179.5)),
+        (Coordinates(lat=-17.5, lng=-179.8), Coordinates(lat=-16.9, lng=178.6)),  # Fiji
+        (Coordinates(lat=52.0, lng=178.0), Coordinates(lat=53.0, lng=-177.0)),  # Aleutians
+    ):
+        exact = calculate_distance(start, end)
+        assert exact < 300
+        for a, b in ((start, end), (end, start)):
+            assert abs(calculate_distance_equirect(a, b) - exact) < exact * 0.01
+
+
+def test_generate_routes_caches_segment_distances():
+    """Test that generated routes carry per-segment distances matching their total"""
+    request = RouteRequest(
+        start=Coordinates(lat=36.0, lng=-5.0),
+        end=Coordinates(lat=38.5, lng=1.0),
+        boat_type=BoatType.SAILBOAT,
+        departure_time="2024-01-15T10:00:00Z"
+    )
+    
+    for route in generate_routes(request):
+        assert len(route.segment_distances) == len(route.waypoints) - 1
+        assert round(sum(route.segment_distances), 1) == route.distance
+
+
+def test_recalculated_routes_cache_segment_headings():
+    """Test that headings are computed by the wind pass, not by generate_routes"""
+    request = RouteRequest(
+        start=Coordinates(lat=36.0, lng=-5.0),
+        end=Coordinates(lat=38.5, lng=1.0),
+        boat_type=BoatType.SAILBOAT,
+        departure_time="2024-01-15T10:00:00Z"
+    )
+    
+    for route in generate_routes(request):
+        assert route.segment_headings is None
+        for waypoint in route.waypoints:
+            waypoint.weather = WaypointWeather(
+                wind_speed=12.0, wind_direction=0.0, wave_height=0.3,
+                precipitation=0.0, visibility=20.0, temperature=18.0
+            )
+        
+        recalculated = recalculate_route_times_with_wind(
+            route, BoatType.SAILBOAT, parse_departure_time(request.departure_time)
+        )
+        
+        assert recalculated.segment_headings == [
+            calculate_bearing(prev.position, curr.position)
+            for prev, curr in zip(route.waypoints, route.waypoints[1:])
+        ]
+
+
+def test_distance_and_bearing_matches_separate_helpers():
+    """Test that the fused helper matches calculate_distance/calculate_bearing"""
+    start = Coordinates(lat=36.0, lng=-5.0)
+    for end in (Coordinates(lat=38.5, lng=1.0), Coordinates(lat=30.0, lng=-20.0)):
+        assert calculate_distance_and_bearing(start, end) == (
+            calculate_distance(start, end), calculate_bearing(start, end)
+        )
+
+
+def test_destinations_fan_matches_single_destination():
+    """Test that the fan helper matches calculate_destination per leg"""
+    start = Coordinates(lat=36.0, lng=-5.0)
+    headings = list(range(0, 360, 30)) + [12.5, 359.9]  # whole and fractional degrees
+    distances = [2.5 + h / 100 for h in headings]
+    fan = calculate_destinations(start, distances, headings)
+    for position, distance, heading in zip(fan, distances, headings):
+        assert position == calculate_destination(start, distance, heading)
+
+
+# ============================================================================
+# ROUTE SCORER TESTS
+# ============================================================================
+
+def _routes_with_weather(wind_speeds):
+    """Generate the 3 standard routes and give each one uniform wind"""
+    request = RouteRequest(
+        start=Coordinates(lat=36.0, lng=-5.0),
+        end=Coordinates(lat=38.5, lng=1.0),
+        boat_type=BoatType.MOTORBOAT,
+        departure_time="2024-01-15T10:00:00Z"
+    )
+    routes = generate_routes(request)
+    for route, wind_speed in zip(routes, wind_speeds):
+        for waypoint in route.waypoints:
+            waypoint.weather = WaypointWeather(
+                wind_speed=wind_speed, wind_direction=0.0, wave_height=0.3,
+                precipitation=0.0, visibility=20.0, temperature=18.0
+            )
+    return routes
+
+
+def test_score_routes_sorted_best_first():
+    """Test that score_routes returns routes ordered by score"""
+    routes = _routes_with_weather([12.0, 45.0, 12.0])
+    
+    scored = score_routes(routes, BoatType.MOTORBOAT, routes[0].distance)
+    
+    assert [r.score for r in scored] == sorted((r.score for r in scored), reverse=True)
+    assert scored[-1].name == "Port Route", "Route through dangerous wind should rank last"
+
+
+def test_score_routes_reports_dangerous_wind_once():
+    """Test that a repeated dangerous reading produces a single warning"""
+    routes = _routes_with_weather([45.0, 45.0, 45.0])
+    
+    scored = score_routes(routes, BoatType.MOTORBOAT, routes[0].distance)
+    
+    for route in scored:
+        assert route.warnings[0].startswith("DANGER:")
+        assert route.warnings.count("Dangerous wind: 45.0kt exceeds safe limit") == 1
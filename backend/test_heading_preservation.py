@@ -4,13 +4,53 @@ Test that heading is preserved when weather is fetched and attached to waypoints
 
 import logging
 from datetime import datetime
+from unittest.mock import patch
 from models import Coordinates, Waypoint, WaypointWeather, BoatType
+import weather_fetcher
+from weather_fetcher import fetch_weather_for_waypoints
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class _FakeResponse:
+    """Minimal stand-in for a successful requests.Response."""
+    ok = True
+    status_code = 200
+    
+    def __init__(self, data):
+        self._data = data
+    
+    def json(self):
+        return self._data
+
+
+def _stub_open_meteo(wind_directions):
+    """
+    Patch HTTP_SESSION.get with batched Open-Meteo responses (no network).
+    
+    Point i gets a constant wind direction of wind_directions[i] for every
+    hour, so tests can tell which response ended up on which waypoint.
+    """
+    def fake_get(url, params=None, timeout=None):
+        if url == weather_fetcher.MARINE_API_URL:
+            return _FakeResponse([{'hourly': {'wave_height': [1.5] * 48}} for _ in wind_directions])
+        return _FakeResponse([
+            {'hourly': {
+                'wind_speed_10m': [20.0] * 48,
+                'wind_direction_10m': [direction] * 48,
+                'wind_gusts_10m': [25.0] * 48,
+                'temperature_2m': [15.0] * 48,
+                'precipitation': [0.0] * 48,
+                'visibility': [10000.0] * 48,
+            }}
+            for direction in wind_directions
+        ])
+    
+    return patch.object(weather_fetcher.HTTP_SESSION, "get", new=fake_get)
+
+
 def test_heading_preserved_in_waypoint():
     """Test that waypoint heading is preserved through dataclass operations."""
     logger.info("=" * 60)
@@ -28,33 +68,62 @@ def test_heading_preserved_in_waypoint():
     logger.info(f"Original waypoint heading: {original_waypoint.heading}°")
     assert original_waypoint.heading == 45.0, "Original heading should be preserved"
     
-    # Simulate what weather_fetcher.py does: create new waypoint with weather but preserve heading
-    new_weather = WaypointWeather(
-        wind_speed=15.0,
-        wind_direction=90.0,
-        wave_height=1.5,
-        precipitation=0.0,
-        visibility=10.0,
-        temperature=10.0
-    )
-    
-    updated_waypoint = Waypoint(
-        position=original_waypoint.position,
-        estimated_arrival=original_waypoint.estimated_arrival,
-        weather=new_weather,
-        heading=original_waypoint.heading  # THIS IS THE FIX!
-    )
+    # Fetch weather for it (API stubbed) - weather is attached in place
+    original_position = original_waypoint.position
+    with _stub_open_meteo([90.0]):
+        updated_waypoint = fetch_weather_for_waypoints([original_waypoint])[0]
     
     logger.info(f"Updated waypoint heading: {updated_waypoint.heading}°")
     logger.info(f"Updated waypoint weather: {updated_waypoint.weather}")
     
     assert updated_waypoint.heading == 45.0, "Heading should be preserved after adding weather"
     assert updated_waypoint.weather is not None, "Weather should be added"
-    assert updated_waypoint.position == original_waypoint.position, "Position should be preserved"
+    assert updated_waypoint.weather.wind_direction == 90, "Weather should come from the API response"
+    assert updated_waypoint.position == original_position, "Position should be preserved"
     
     logger.info("✓ PASS: Heading preserved when weather is added to waypoint")
 
 
+def test_fetch_weather_attaches_in_place():
+    """Test that fetch_weather_for_waypoints fills in the caller's waypoints and returns them."""
+    logger.info("\n" + "=" * 60)
+    logger.info("TEST: Weather Attached In Place")
+    logger.info("=" * 60)
+    
+    waypoints = [
+        Waypoint(
+            position=Coordinates(lat=50.0, lng=-2.0),
+            estimated_arrival="2024-01-15T10:00:00Z",
+            heading=None
+        ),
+        Waypoint(
+            position=Coordinates(lat=50.2, lng=-1.8),
+            estimated_arrival="2024-01-15T12:30:00+00:00",
+            heading=30.0
+        ),
+        Waypoint(
+            position=Coordinates(lat=50.4, lng=-1.5),
+            estimated_arrival="2024-01-16T01:15:00+00:00",  # next day
+            heading=75.0
+        ),
+    ]
+    originals = [(wp, wp.position, wp.estimated_arrival, wp.heading) for wp in waypoints]
+    
+    with _stub_open_meteo([10.0, 20.0, 30.0]):
+        result = fetch_weather_for_waypoints(waypoints)
+    
+    assert result is waypoints, "Should return the same list it was given"
+    for (wp, position, arrival, heading), direction, returned in zip(originals, [10, 20, 30], result):
+        assert returned is wp, "Should not replace waypoint objects"
+        assert wp.weather is not None, "Weather should be set on every waypoint"
+        assert wp.weather.wind_direction == direction, "Each waypoint should get its own point's weather"
+        assert wp.position is position
+        assert wp.estimated_arrival == arrival
+        assert wp.heading == heading
+    
+    logger.info("✓ PASS: Weather attached in place, headings and arrival times intact")
+
+
 def test_heading_none_handling():
     """Test that waypoints without heading (None) are handled correctly."""
     logger.info("\n" + "=" * 60)
@@ -104,6 +173,7 @@ if __name__ == "__main__":
     
     try:
         test_heading_preserved_in_waypoint()
+        test_fetch_weather_attaches_in_place()
         test_heading_none_handling()
         
         logger.info("\n" + "=" * 60)
@@ -6,6 +6,7 @@ correctly when calculating no-go zone violations for frontend display.
 """
 
 import logging
+from dataclasses import replace
 from models import Coordinates, Waypoint, WaypointWeather, BoatType
 from polars import calculate_wind_angle, is_in_no_go_zone
 
@@ -13,6 +14,26 @@ from polars import calculate_wind_angle, is_in_no_go_zone
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Shared conditions for every scenario; tests only vary the wind direction
+_WEATHER_TEMPLATE = WaypointWeather(
+    wind_speed=15.0,
+    wind_direction=0.0,
+    wave_height=1.5,
+    precipitation=0.0,
+    visibility=10.0,
+    temperature=10.0
+)
+
+
+def _make_waypoint(heading: float, wind_direction: float) -> Waypoint:
+    """Build the shared test waypoint with a given stored heading and wind direction."""
+    return Waypoint(
+        position=Coordinates(lat=50.0, lng=-2.0),
+        estimated_arrival="2024-01-15T10:00:00Z",
+        weather=replace(_WEATHER_TEMPLATE, wind_direction=wind_direction),
+        heading=heading
+    )
+
 
 def test_no_go_zone_detection_with_stored_heading():
     """
@@ -29,31 +50,19 @@ def test_no_go_zone_detection_with_stored_heading():
     
     # Create a waypoint with stored heading sailing upwind (in no-go zone)
     # Boat heading 0° (north), wind from 0° (north) = 0° wind angle (headwind, in no-go zone)
-    waypoint = Waypoint(
-        position=Coordinates(lat=50.0, lng=-2.0),
-        estimated_arrival="2024-01-15T10:00:00Z",
-        weather=WaypointWeather(
-            wind_speed=15.0,
-            wind_direction=0.0,  # Wind from north
-            wave_height=1.5,
-            precipitation=0.0,
-            visibility=10.0,
-            temperature=10.0
-        ),
-        heading=0.0  # Sailing north (INTO the wind - no-go zone!)
-    )
+    waypoint = _make_waypoint(heading=0.0, wind_direction=0.0)
     
     # Calculate wind angle using stored heading
     wind_angle = calculate_wind_angle(waypoint.heading, waypoint.weather.wind_direction)
     
-    logger.info(f"Waypoint heading: {waypoint.heading:.1f}°")
-    logger.info(f"Wind direction: {waypoint.weather.wind_direction:.1f}°")
-    logger.info(f"Calculated wind angle: {wind_angle:.1f}°")
+    logger.info("Waypoint heading: %.1f°", waypoint.heading)
+    logger.info("Wind direction: %.1f°", waypoint.weather.wind_direction)
+    logger.info("Calculated wind angle: %.1f°", wind_angle)
     
     # Check if in no-go zone
     in_no_go = is_in_no_go_zone(wind_angle, BoatType.SAILBOAT.value)
     
-    logger.info(f"In no-go zone (sailboat): {in_no_go}")
+    logger.info("In no-go zone (sailboat): %s", in_no_go)
     
     assert in_no_go, "Should be in no-go zone when sailing directly into wind"
     logger.info("✓ PASS: Correctly identified no-go zone violation")
@@ -69,31 +78,19 @@ def test_no_go_zone_not_triggered_on_beam_reach():
     
     # Create a waypoint sailing perpendicular to wind (beam reach)
     # Boat heading 0° (north), wind from 90° (east) = 90° wind angle (beam reach, VALID)
-    waypoint = Waypoint(
-        position=Coordinates(lat=50.0, lng=-2.0),
-        estimated_arrival="2024-01-15T10:00:00Z",
-        weather=WaypointWeather(
-            wind_speed=15.0,
-            wind_direction=90.0,  # Wind from east
-            wave_height=1.5,
-            precipitation=0.0,
-            visibility=10.0,
-            temperature=10.0
-        ),
-        heading=0.0  # Sailing north (PERPENDICULAR to wind - beam reach)
-    )
+    waypoint = _make_waypoint(heading=0.0, wind_direction=90.0)
     
     # Calculate wind angle using stored heading
     wind_angle = calculate_wind_angle(waypoint.heading, waypoint.weather.wind_direction)
     
-    logger.info(f"Waypoint heading: {waypoint.heading:.1f}°")
-    logger.info(f"Wind direction: {waypoint.weather.wind_direction:.1f}°")
-    logger.info(f"Calculated wind angle: {wind_angle:.1f}°")
+    logger.info("Waypoint heading: %.1f°", waypoint.heading)
+    logger.info("Wind direction: %.1f°", waypoint.weather.wind_direction)
+    logger.info("Calculated wind angle: %.1f°", wind_angle)
     
     # Check if in no-go zone
     in_no_go = is_in_no_go_zone(wind_angle, BoatType.SAILBOAT.value)
     
-    logger.info(f"In no-go zone (sailboat): {in_no_go}")
+    logger.info("In no-go zone (sailboat): %s", in_no_go)
     
     assert not in_no_go, "Should NOT be in no-go zone on beam reach"
     logger.info("✓ PASS: Correctly identified valid sailing angle (beam reach)")
@@ -111,31 +108,19 @@ def test_no_go_zone_borderline_close_hauled():
     
     # Close-hauled just outside no-go zone
     # Boat heading 50° (NE), wind from 0° (north) = 50° wind angle
-    waypoint = Waypoint(
-        position=Coordinates(lat=50.0, lng=-2.0),
-        estimated_arrival="2024-01-15T10:00:00Z",
-        weather=WaypointWeather(
-            wind_speed=15.0,
-            wind_direction=0.0,  # Wind from north
-            wave_height=1.5,
-            precipitation=0.0,
-            visibility=10.0,
-            temperature=10.0
-        ),
-        heading=50.0  # Sailing NE at 50° wind angle (just outside no-go zone)
-    )
+    waypoint = _make_waypoint(heading=50.0, wind_direction=0.0)
     
     # Calculate wind angle
     wind_angle = calculate_wind_angle(waypoint.heading, waypoint.weather.wind_direction)
     
-    logger.info(f"Waypoint heading: {waypoint.heading:.1f}°")
-    logger.info(f"Wind direction: {waypoint.weather.wind_direction:.1f}°")
-    logger.info(f"Calculated wind angle: {wind_angle:.1f}°")
+    logger.info("Waypoint heading: %.1f°", waypoint.heading)
+    logger.info("Wind direction: %.1f°", waypoint.weather.wind_direction)
+    logger.info("Calculated wind angle: %.1f°", wind_angle)
     
     # Check if in no-go zone
     in_no_go = is_in_no_go_zone(wind_angle, BoatType.SAILBOAT.value)
     
-    logger.info(f"In no-go zone (sailboat): {in_no_go}")
+    logger.info("In no-go zone (sailboat): %s", in_no_go)
     
     # At 50°, should NOT be in no-go zone (threshold is 45°)
     assert not in_no_go, "50° wind angle should be just outside no-go zone"
@@ -151,33 +136,21 @@ def test_motorboat_no_no_go_zone():
     logger.info("=" * 60)
     
     # Even sailing directly into wind, motorboat should be fine
-    waypoint = Waypoint(
-        position=Coordinates(lat=50.0, lng=-2.0),
-        estimated_arrival="2024-01-15T10:00:00Z",
-        weather=WaypointWeather(
-            wind_speed=15.0,
-            wind_direction=0.0,  # Wind from north
-            wave_height=1.5,
-            precipitation=0.0,
-            visibility=10.0,
-            temperature=10.0
-        ),
-        heading=0.0  # Sailing north (into wind)
-    )
+    waypoint = _make_waypoint(heading=0.0, wind_direction=0.0)
     
     # Calculate wind angle
     wind_angle = calculate_wind_angle(waypoint.heading, waypoint.weather.wind_direction)
     
-    logger.info(f"Waypoint heading: {waypoint.heading:.1f}°")
-    logger.info(f"Wind direction: {waypoint.weather.wind_direction:.1f}°")
-    logger.info(f"Calculated wind angle: {wind_angle:.1f}°")
+    logger.info("Waypoint heading: %.1f°", waypoint.heading)
+    logger.info("Wind direction: %.1f°", waypoint.weather.wind_direction)
+    logger.info("Calculated wind angle: %.1f°", wind_angle)
     
     # Check if motorboat is in no-go zone
     in_no_go_sailboat = is_in_no_go_zone(wind_angle, BoatType.SAILBOAT.value)
     in_no_go_motorboat = is_in_no_go_zone(wind_angle, BoatType.MOTORBOAT.value)
     
-    logger.info(f"In no-go zone (sailboat): {in_no_go_sailboat}")
-    logger.info(f"In no-go zone (motorboat): {in_no_go_motorboat}")
+    logger.info("In no-go zone (sailboat): %s", in_no_go_sailboat)
+    logger.info("In no-go zone (motorboat): %s", in_no_go_motorboat)
     
     assert in_no_go_sailboat, "Sailboat should be in no-go zone at 0° wind angle"
     assert not in_no_go_motorboat, "Motorboat should never be in no-go zone"
@@ -200,6 +173,6 @@ if __name__ == "__main__":
         logger.info("=" * 60)
         
     except AssertionError as e:
-        logger.error(f"\n✗ TEST FAILED: {e}")
+        logger.error("\n✗ TEST FAILED: %s", e)
         raise
 
@@ -7,8 +7,7 @@ Run this to diagnose API issues:
 
 import sys
 import logging
-from weather_fetcher import MARINE_API_URL, WEATHER_APIS
-import requests
+from weather_fetcher import MARINE_API_URL, WEATHER_APIS, HTTP_SESSION
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,7 +24,7 @@ def test_single_api_call():
     # Test weather API
     logger.info("\n1. Testing Weather API (Open-Meteo)...")
     try:
-        response = requests.get(WEATHER_APIS['default'], params={
+        response = HTTP_SESSION.get(WEATHER_APIS['default'], params={
             'latitude': '40.0',
             'longitude': '-70.0',
             'hourly': 'wind_speed_10m,wind_direction_10m',
@@ -57,7 +56,7 @@ def test_single_api_call():
     # Test marine API
     logger.info("\n2. Testing Marine API (Open-Meteo Marine)...")
     try:
-        response = requests.get(MARINE_API_URL, params={
+        response = HTTP_SESSION.get(MARINE_API_URL, params={
             'latitude': '40.0',
             'longitude': '-70.0',
             'hourly': 'wave_height',
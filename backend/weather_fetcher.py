@@ -12,7 +12,9 @@ FEATURES:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import logging
+import heapq
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Tuple
 from models import Coordinates, Waypoint, WaypointWeather
@@ -32,6 +34,14 @@ WEATHER_APIS = {
     'gfs': "https://api.open-meteo.com/v1/gfs",          # US NOAA model - best for Americas
 }
 
+# Shared HTTP session so the weather and marine calls (and warm Lambda
+# invocations) reuse pooled keep-alive connections to Open-Meteo instead of
+# paying a TCP+TLS handshake per request. pool_maxsize covers concurrent
+# request threads in the threaded dev server sharing one host. No automatic
+# retries: rate-limit responses (429) are handled explicitly by the callers.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+
 # Corridor width calculation constant
 CORRIDOR_WIDTH_RATIO = 1.0 / 3.0  # Corridor width is 1/3 of route distance
 
@@ -132,7 +142,7 @@ def fetch_weather_for_waypoints(waypoints: List[Waypoint]) -> List[Waypoint]:
         waypoints: List of waypoints (without weather)
         
     Returns:
-        List of waypoints with weather data attached
+        The same waypoints, with weather data attached in place
     """
     if not waypoints:
         return []
@@ -168,7 +178,7 @@ def fetch_weather_for_waypoints(waypoints: List[Waypoint]) -> List[Waypoint]:
     
     try:
         # Fetch weather data with wind gusts
-        weather_response = requests.get(weather_api_url, params={
+        weather_response = HTTP_SESSION.get(weather_api_url, params={
             'latitude': lat_str,
             'longitude': lng_str,
             'hourly': 'temperature_2m,precipitation,visibility,wind_speed_10m,wind_direction_10m,wind_gusts_10m',
@@ -192,7 +202,7 @@ def fetch_weather_for_waypoints(waypoints: List[Waypoint]) -> List[Waypoint]:
     
     try:
         # Fetch marine data (waves)
-        marine_response = requests.get(MARINE_API_URL, params={
+        marine_response = HTTP_SESSION.get(MARINE_API_URL, params={
             'latitude': lat_str,
             'longitude': lng_str,
             'hourly': 'wave_height',
@@ -214,18 +224,19 @@ def fetch_weather_for_waypoints(waypoints: List[Waypoint]) -> List[Waypoint]:
         logger.warning(f"  Warning: Marine API call failed: {e}")
         logger.warning(f"  Error type: {type(e).__name__}")
     
-    # Process response and create updated waypoints
-    updated_waypoints = []
+    # Process response and attach weather to the waypoints
     
     # Check if we got batched response (list of results) or single point response (dict)
     is_batched_weather = isinstance(weather_data, list)
     is_batched_marine = isinstance(marine_data, list)
     
+    first_date = datetime.fromisoformat(start_date).date()
+    
     for i, wp in enumerate(waypoints):
         hour_index = min(arrival_times[i].hour, 23)
         
         # Calculate day offset if route spans multiple days
-        day_offset = (arrival_times[i].date() - datetime.fromisoformat(start_date).date()).days
+        day_offset = (arrival_times[i].date() - first_date).days
         adjusted_hour = day_offset * 24 + hour_index
         
         if is_batched_weather or is_batched_marine:
@@ -235,14 +246,11 @@ def fetch_weather_for_waypoints(waypoints: List[Waypoint]) -> List[Waypoint]:
         else:
             weather = _extract_weather_from_single(weather_data, marine_data, adjusted_hour)
         
-        updated_waypoints.append(Waypoint(
-            position=wp.position,
-            estimated_arrival=wp.estimated_arrival,
-            weather=weather,
-            heading=wp.heading  # Preserve the heading from isochrone propagation
-        ))
-    
-    return updated_waypoints
+        # Attach in place: position, arrival time and the heading from
+        # isochrone propagation are kept as-is, no new Waypoint per point
+        wp.weather = weather
+    
+    return waypoints
 
 
 def _extract_weather_from_single(
@@ -463,8 +471,6 @@ def calculate_forecast_hours_needed(distance_nm: float, avg_boat_speed: float, b
         With 1.5x buffer = 25 hours
         Returns: 25
     """
-    import math
-    
     if avg_boat_speed <= 0:
         avg_boat_speed = 5.0  # Fallback to conservative speed
     
@@ -750,7 +756,7 @@ def fetch_regional_weather_grid(
         try:
             # Fetch weather data
             logger.warning(f"  Chunk {chunk_idx + 1}/{chunk_count}: Fetching weather for {len(chunk)} points...")
-            weather_response = requests.get(weather_api_url, params={
+            weather_response = HTTP_SESSION.get(weather_api_url, params={
                 'latitude': lat_str,
                 'longitude': lng_str,
                 'hourly': 'temperature_2m,precipitation,visibility,wind_speed_10m,wind_direction_10m,wind_gusts_10m',
@@ -776,7 +782,7 @@ def fetch_regional_weather_grid(
             
             # Fetch marine data (waves)
             logger.warning(f"  Chunk {chunk_idx + 1}/{chunk_count}: Fetching marine data...")
-            marine_response = requests.get(MARINE_API_URL, params={
+            marine_response = HTTP_SESSION.get(MARINE_API_URL, params={
                 'latitude': lat_str,
                 'longitude': lng_str,
                 'hourly': 'wave_height',
@@ -856,11 +862,54 @@ def interpolate_weather(
     Returns:
         Interpolated WaypointWeather object
     """
+    time_idx, time_weight = _find_time_bracket(time, weather_grid['times'])
+    return _interpolate_weather_at(
+        position, time_idx, time_weight,
+        weather_grid['grid_points'], weather_grid['weather_data']
+    )
+
+
+def interpolate_weather_many(
+    positions: List[Coordinates],
+    time: datetime,
+    weather_grid: Dict[str, Any]
+) -> List[WaypointWeather]:
+    """
+    Interpolate weather at several positions that share the same time.
+    
+    Equivalent to calling interpolate_weather() per position, but the time
+    bracket is located once for the whole batch (e.g. every child of an
+    isochrone point arrives at the same time).
+    
+    Args:
+        positions: Target positions
+        time: Target time shared by all positions
+        weather_grid: Weather grid from fetch_regional_weather_grid()
+        
+    Returns:
+        Interpolated WaypointWeather objects, one per position
+    """
+    time_idx, time_weight = _find_time_bracket(time, weather_grid['times'])
     grid_points = weather_grid['grid_points']
-    times = weather_grid['times']
     weather_data = weather_grid['weather_data']
+    return [
+        _interpolate_weather_at(position, time_idx, time_weight, grid_points, weather_data)
+        for position in positions
+    ]
+
+
+def _find_time_bracket(time: datetime, times: List[datetime]) -> Tuple[int, float]:
+    """
+    Find the grid time index and weight for linear interpolation in time.
     
-    # Find time indices for temporal interpolation
+    Args:
+        time: Target time
+        times: Grid times in ascending order
+        
+    Returns:
+        Tuple of (time_idx, time_weight) - interpolate between times[time_idx]
+        and times[time_idx + 1] with weight time_weight on the latter
+    """
     if time <= times[0]:
         time_idx = 0
         time_weight = 0.0
@@ -880,19 +929,42 @@ def interpolate_weather(
             time_idx = 0
             time_weight = 0.0
     
-    # Find 4 nearest grid points for spatial interpolation
-    # Sort all points by distance to find closest ones
-    distances = []
-    for lat, lng in grid_points:
-        dist = math.sqrt((lat - position.lat)**2 + (lng - position.lng)**2)
-        distances.append((dist, lat, lng))
+    return time_idx, time_weight
+
+
+def _interpolate_weather_at(
+    position: Coordinates,
+    time_idx: int,
+    time_weight: float,
+    grid_points: List[Tuple[float, float]],
+    weather_data: Dict[Tuple[float, float, int], WaypointWeather]
+) -> WaypointWeather:
+    """
+    Spatially interpolate weather at a position for an already-resolved time bracket.
     
-    distances.sort()
+    Args:
+        position: Target position
+        time_idx: Index of the earlier bracketing grid time
+        time_weight: Weight of the later grid time (0-1)
+        grid_points: Grid (lat, lng) points
+        weather_data: Weather keyed by (lat, lng, time_idx)
+        
+    Returns:
+        Interpolated WaypointWeather object
+    """
+    # Find 4 nearest grid points for spatial interpolation
+    # nsmallest keeps a 4-item heap instead of sorting every grid point
+    # (same result and tie order as sorting and slicing)
+    pos_lat = position.lat
+    pos_lng = position.lng
     
     # Use 4 closest points for bilinear interpolation
     # If we have exactly aligned grid, use proper bilinear interpolation
     # Otherwise, use distance-weighted interpolation
-    closest_points = distances[:4]
+    closest_points = heapq.nsmallest(4, [
+        (math.sqrt((lat - pos_lat)**2 + (lng - pos_lng)**2), lat, lng)
+        for lat, lng in grid_points
+    ])
     
     if not closest_points:
         # No grid data available, return default
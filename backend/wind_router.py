@@ -23,9 +23,12 @@ from enum import Enum
 from models import Coordinates, Waypoint, RouteRequest, BoatType, BOAT_PROFILES
 from route_generator import (
     GeneratedRoute, RouteType, calculate_distance, calculate_bearing,
-    calculate_destination, calculate_route_distance, format_duration
+    calculate_distance_and_bearing, calculate_destination, calculate_destinations, calculate_route_distance,
+    format_duration
+)
+from weather_fetcher import (
+    fetch_regional_weather_grid, interpolate_weather, interpolate_weather_many, calculate_forecast_hours_needed
 )
-from weather_fetcher import fetch_regional_weather_grid, interpolate_weather, calculate_forecast_hours_needed
 from polars import get_boat_speed, calculate_wind_angle, get_optimal_vmg_angle, normalize_angle
 
 # Set up logging
@@ -121,8 +124,7 @@ def analyze_wind_corridor(
     """
     # Sample 10 points along direct route
     num_samples = 10
-    bearing = calculate_bearing(start, end)
-    total_distance = calculate_distance(start, end)
+    total_distance, bearing = calculate_distance_and_bearing(start, end)
     
     # Get departure time from weather grid
     departure_time = weather_grid['times'][0]
@@ -132,21 +134,14 @@ def analyze_wind_corridor(
     wind_directions_cos = []
     wave_heights = []
     
-    for i in range(num_samples + 1):
-        fraction = i / num_samples
-        distance = total_distance * fraction
-        
-        # Calculate position
-        if i == 0:
-            position = start
-        elif i == num_samples:
-            position = end
-        else:
-            position = calculate_destination(start, distance, bearing)
-        
-        # Get weather at this position (at departure time)
-        weather = interpolate_weather(position, departure_time, weather_grid)
-        
+    # Sample positions: start, evenly spaced interior points, end
+    interior_distances = [total_distance * (i / num_samples) for i in range(1, num_samples)]
+    positions = [start]
+    positions.extend(calculate_destinations(start, interior_distances, [bearing] * len(interior_distances)))
+    positions.append(end)
+    
+    # Get weather at every sample position in one batch (all at departure time)
+    for weather in interpolate_weather_many(positions, departure_time, weather_grid):
         wind_speeds.append(weather.wind_speed)
         wave_heights.append(weather.wave_height)
         
@@ -207,6 +202,7 @@ def create_waypoints_with_timing(
     """
     waypoints = []
     current_time = departure_time
+    penalty_speed = BOAT_PROFILES[BoatType(boat_type)].avg_speed * 0.2
     
     for i, pos in enumerate(positions):
         waypoints.append(Waypoint(
@@ -217,17 +213,16 @@ def create_waypoints_with_timing(
         # Calculate time to next waypoint
         if i < len(positions) - 1:
             next_pos = positions[i + 1]
-            distance = calculate_distance(pos, next_pos)
+            distance, heading = calculate_distance_and_bearing(pos, next_pos)
             
             # Get weather and boat speed
             weather = interpolate_weather(pos, current_time, weather_grid)
-            heading = calculate_bearing(pos, next_pos)
             twa = calculate_wind_angle(heading, weather.wind_direction)
             boat_speed = get_boat_speed(weather.wind_speed, twa, boat_type)
             
             # Use minimum speed if in no-go zone
             if boat_speed <= 0:
-                boat_speed = BOAT_PROFILES[BoatType(boat_type)].avg_speed * 0.2
+                boat_speed = penalty_speed
             
             # Calculate time to next waypoint
             hours = distance / boat_speed
@@ -512,8 +507,7 @@ def generate_downwind_routes(
         List of 3 downwind route options
     """
     departure = datetime.fromisoformat(request.departure_time.replace('Z', '+00:00'))
-    total_distance = calculate_distance(request.start, request.end)
-    destination_bearing = calculate_bearing(request.start, request.end)
+    total_distance, destination_bearing = calculate_distance_and_bearing(request.start, request.end)
     
     routes = []
     num_waypoints = 6
@@ -642,8 +636,7 @@ def generate_reaching_routes(
         List of 3 reaching route options
     """
     departure = datetime.fromisoformat(request.departure_time.replace('Z', '+00:00'))
-    total_distance = calculate_distance(request.start, request.end)
-    destination_bearing = calculate_bearing(request.start, request.end)
+    total_distance, destination_bearing = calculate_distance_and_bearing(request.start, request.end)
     
     routes = []
     num_waypoints = 6
@@ -5,17 +5,27 @@ This module handles all the geographic calculations:
 - Distance between points (Haversine formula)
 - Bearing/direction between points  
 - Generating waypoints along direct and curved paths
+
+NOTE: The geometry helpers work on single points and use the `math` module
+on purpose. For scalars `math.sin`/`math.radians` are several times faster
+than their numpy counterparts (numpy allocates a 0-d array per call), so
+don't swap them for numpy "for consistency" - that slows down every caller,
+including recalculate_route_times_with_wind().
 """
 
 import math
 from datetime import datetime, timedelta
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from models import Coordinates, Waypoint, RouteRequest, BoatType, BOAT_PROFILES, RouteType
+from polars import get_boat_speed, calculate_wind_angle
 from dataclasses import dataclass
 
 
 # Earth's radius in nautical miles
 EARTH_RADIUS_NM = 3440.065
+# Nautical miles per degree of great-circle arc
+NM_PER_DEGREE = EARTH_RADIUS_NM * math.pi / 180
 
 
 def to_radians(degrees: float) -> float:
@@ -28,6 +38,15 @@ def to_degrees(radians: float) -> float:
     return radians * (180 / math.pi)
 
 
+# sin/cos of every whole-degree heading, so heading fans (isochrone propagation
+# tries integer headings 0-359) skip the libm calls. Built with to_radians() so
+# lookups are bit-identical to computing them directly.
+_HEADING_SIN_COS = {
+    heading: (math.sin(to_radians(heading)), math.cos(to_radians(heading)))
+    for heading in range(360)
+}
+
+
 def calculate_distance(start: Coordinates, end: Coordinates) -> float:
     """
     Calculate distance between two points using Haversine formula.
@@ -44,19 +63,78 @@ def calculate_distance(start: Coordinates, end: Coordinates) -> float:
     """
     lat1 = to_radians(start.lat)
     lat2 = to_radians(end.lat)
-    delta_lat = to_radians(end.lat - start.lat)
-    delta_lng = to_radians(end.lng - start.lng)
+    sin_half_dlat = math.sin(to_radians(end.lat - start.lat) * 0.5)
+    sin_half_dlng = math.sin(to_radians(end.lng - start.lng) * 0.5)
 
-    # Haversine formula
-    a = (math.sin(delta_lat / 2) ** 2 + 
-         math.cos(lat1) * math.cos(lat2) * 
-         math.sin(delta_lng / 2) ** 2)
+    # Haversine formula (asin form: one sqrt instead of two plus atan2)
+    a = (sin_half_dlat * sin_half_dlat +
+         math.cos(lat1) * math.cos(lat2) *
+         sin_half_dlng * sin_half_dlng)
     
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    c = 2 * math.asin(math.sqrt(a) if a < 1.0 else 1.0)
     
     return EARTH_RADIUS_NM * c
 
 
+def calculate_distances_to(positions: List[Coordinates], end: Coordinates) -> List[float]:
+    """
+    Haversine distances from many positions to one shared end point.
+    
+    Same results as calling calculate_distance(position, end) per position,
+    but the end point's radian conversion and cos(lat) are computed once for
+    the whole batch (e.g. every isochrone point against the destination).
+    
+    Args:
+        positions: Starting coordinates
+        end: Common ending coordinates
+        
+    Returns:
+        Distances in nautical miles, one per position
+    """
+    end_lat = end.lat
+    end_lng = end.lng
+    cos_lat2 = math.cos(to_radians(end_lat))
+    
+    distances = []
+    for start in positions:
+        sin_half_dlat = math.sin(to_radians(end_lat - start.lat) * 0.5)
+        sin_half_dlng = math.sin(to_radians(end_lng - start.lng) * 0.5)
+        a = (sin_half_dlat * sin_half_dlat +
+             math.cos(to_radians(start.lat)) * cos_lat2 *
+             sin_half_dlng * sin_half_dlng)
+        distances.append(EARTH_RADIUS_NM * (2 * math.asin(math.sqrt(a) if a < 1.0 else 1.0)))
+    
+    return distances
+
+
+def calculate_distance_equirect(start: Coordinates, end: Coordinates) -> float:
+    """
+    Approximate distance using the equirectangular (flat-earth) projection.
+    
+    One cos and one sqrt instead of Haversine's trig chain. Error stays well
+    under 1% for the few-hundred-nm legs the router compares, which is fine
+    for pruning decisions but not for reported route distances - use
+    calculate_distance() for those.
+    
+    Args:
+        start: Starting coordinates
+        end: Ending coordinates
+        
+    Returns:
+        Approximate distance in nautical miles
+    """
+    dlat = end.lat - start.lat
+    # Take the short way round across the antimeridian (inputs are -180..180,
+    # so one wrap brings the difference into [-180, 180])
+    dlng = end.lng - start.lng
+    if dlng > 180.0:
+        dlng -= 360.0
+    elif dlng < -180.0:
+        dlng += 360.0
+    dlng *= math.cos(to_radians((start.lat + end.lat) * 0.5))
+    return NM_PER_DEGREE * math.sqrt(dlat * dlat + dlng * dlng)
+
+
 def calculate_bearing(start: Coordinates, end: Coordinates) -> float:
     """
     Calculate the initial bearing (direction) from start to end.
@@ -76,10 +154,71 @@ def calculate_bearing(start: Coordinates, end: Coordinates) -> float:
     x = (math.cos(lat1) * math.sin(lat2) - 
          math.sin(lat1) * math.cos(lat2) * math.cos(delta_lng))
     
-    bearing = to_degrees(math.atan2(y, x))
+    # Normalize to 0-360: atan2 gives (-180, 180], so one conditional
+    # subtraction replaces the float modulo (same result, exact)
+    bearing = to_degrees(math.atan2(y, x)) + 360
+    if bearing >= 360:
+        bearing -= 360
+    return bearing
+
+
+
+def calculate_distance_and_bearing(start: Coordinates, end: Coordinates) -> Tuple[float, float]:
+    """
+    Calculate Haversine distance and initial bearing in one pass.
+    
+    Equivalent to (calculate_distance(start, end), calculate_bearing(start, end))
+    but shares the radian conversions and cos(lat) terms between the two.
+    
+    Args:
+        start: Starting coordinates
+        end: Ending coordinates
+        
+    Returns:
+        Tuple of (distance in nautical miles, bearing in degrees 0-360)
+    """
+    lat1 = to_radians(start.lat)
+    lat2 = to_radians(end.lat)
+    delta_lng = to_radians(end.lng - start.lng)
+    cos_lat1 = math.cos(lat1)
+    cos_lat2 = math.cos(lat2)
+    
+    # Distance (Haversine, asin form)
+    sin_half_dlat = math.sin(to_radians(end.lat - start.lat) * 0.5)
+    sin_half_dlng = math.sin(delta_lng * 0.5)
+    a = (sin_half_dlat * sin_half_dlat +
+         cos_lat1 * cos_lat2 * sin_half_dlng * sin_half_dlng)
+    distance = EARTH_RADIUS_NM * 2 * math.asin(math.sqrt(a) if a < 1.0 else 1.0)
+    
+    # Bearing
+    y = math.sin(delta_lng) * cos_lat2
+    x = (cos_lat1 * math.sin(lat2) -
+         math.sin(lat1) * cos_lat2 * math.cos(delta_lng))
+    bearing = to_degrees(math.atan2(y, x)) + 360
+    if bearing >= 360:
+        bearing -= 360
     
-    # Normalize to 0-360
-    return (bearing + 360) % 360
+    return distance, bearing
+
+
+@lru_cache(maxsize=128)
+def parse_departure_time(departure_time: str) -> datetime:
+    """
+    Parse an ISO 8601 departure time, accepting a trailing 'Z' for UTC.
+    
+    Cached because bursty traffic tends to repeat the same departure string
+    (datetime objects are immutable, so sharing them is safe).
+    
+    Args:
+        departure_time: ISO 8601 string (e.g. "2024-01-15T10:00:00Z")
+        
+    Returns:
+        Parsed datetime
+    """
+    if departure_time.endswith('Z'):
+        return datetime.fromisoformat(departure_time[:-1] + '+00:00')
+    return datetime.fromisoformat(departure_time)
+
 
 
 def calculate_destination(start: Coordinates, distance: float, bearing: float) -> Coordinates:
@@ -96,27 +235,84 @@ def calculate_destination(start: Coordinates, distance: float, bearing: float) -
     """
     lat1 = to_radians(start.lat)
     lng1 = to_radians(start.lng)
-    bearing_rad = to_radians(bearing)
+    sin_lat1 = math.sin(lat1)
+    cos_lat1 = math.cos(lat1)
+    
+    # Whole-degree bearings come from the lookup table
+    sin_cos = _HEADING_SIN_COS.get(bearing)
+    if sin_cos is None:
+        bearing_rad = to_radians(bearing)
+        sin_cos = (math.sin(bearing_rad), math.cos(bearing_rad))
+    sin_bearing, cos_bearing = sin_cos
+    
+    angular_distance = distance / EARTH_RADIUS_NM
+    sin_d = math.sin(angular_distance)
+    cos_d = math.cos(angular_distance)
 
-    lat2 = math.asin(
-        math.sin(lat1) * math.cos(distance / EARTH_RADIUS_NM) +
-        math.cos(lat1) * math.sin(distance / EARTH_RADIUS_NM) * math.cos(bearing_rad)
-    )
+    lat2 = math.asin(sin_lat1 * cos_d + cos_lat1 * sin_d * cos_bearing)
 
     lng2 = lng1 + math.atan2(
-        math.sin(bearing_rad) * math.sin(distance / EARTH_RADIUS_NM) * math.cos(lat1),
-        math.cos(distance / EARTH_RADIUS_NM) - math.sin(lat1) * math.sin(lat2)
+        sin_bearing * sin_d * cos_lat1,
+        cos_d - sin_lat1 * math.sin(lat2)
     )
 
     return Coordinates(lat=to_degrees(lat2), lng=to_degrees(lng2))
 
 
+def calculate_destinations(
+    start: Coordinates,
+    distances: List[float],
+    bearings: List[float]
+) -> List[Coordinates]:
+    """
+    Calculate destination points for a fan of legs leaving the same start.
+    
+    Same result as calling calculate_destination() per leg, but the start
+    latitude's sin/cos are computed once for the whole fan and whole-degree
+    bearings come from a lookup table.
+    
+    Args:
+        start: Starting coordinates shared by every leg
+        distances: Distance of each leg in nautical miles
+        bearings: Direction of each leg in degrees
+        
+    Returns:
+        Destination coordinates, one per (distance, bearing) pair
+    """
+    lat1 = to_radians(start.lat)
+    lng1 = to_radians(start.lng)
+    sin_lat1 = math.sin(lat1)
+    cos_lat1 = math.cos(lat1)
+    
+    destinations = []
+    for distance, bearing in zip(distances, bearings):
+        sin_cos = _HEADING_SIN_COS.get(bearing)
+        if sin_cos is None:
+            bearing_rad = to_radians(bearing)
+            sin_cos = (math.sin(bearing_rad), math.cos(bearing_rad))
+        sin_bearing, cos_bearing = sin_cos
+        angular_distance = distance / EARTH_RADIUS_NM
+        sin_d = math.sin(angular_distance)
+        cos_d = math.cos(angular_distance)
+        
+        lat2 = math.asin(sin_lat1 * cos_d + cos_lat1 * sin_d * cos_bearing)
+        lng2 = lng1 + math.atan2(
+            sin_bearing * sin_d * cos_lat1,
+            cos_d - sin_lat1 * math.sin(lat2)
+        )
+        destinations.append(Coordinates(lat=to_degrees(lat2), lng=to_degrees(lng2)))
+    
+    return destinations
+
+
 def generate_direct_waypoints(
     start: Coordinates,
     end: Coordinates,
     num_waypoints: int,
     departure_time: datetime,
-    avg_speed: float
+    avg_speed: float,
+    total_distance: Optional[float] = None,
+    main_bearing: Optional[float] = None
 ) -> List[Waypoint]:
     """
     Generate waypoints along a direct (straight) path.
@@ -127,46 +323,71 @@ def generate_direct_waypoints(
         num_waypoints: Number of intermediate points (total will be num_waypoints + 1)
         departure_time: When the journey starts
         avg_speed: Average boat speed in knots
+        total_distance: Precomputed start-to-end distance (computed if not provided)
+        main_bearing: Precomputed start-to-end bearing (computed if not provided)
         
     Returns:
         List of waypoints with estimated arrival times
     """
     waypoints = []
-    total_distance = calculate_distance(start, end)
-    bearing = calculate_bearing(start, end)
+    if total_distance is None and main_bearing is None:
+        total_distance, main_bearing = calculate_distance_and_bearing(start, end)
+    elif total_distance is None:
+        total_distance = calculate_distance(start, end)
+    elif main_bearing is None:
+        main_bearing = calculate_bearing(start, end)
+    bearing = main_bearing
+    
+    # Start and end are fixed, so only the intermediate points need computing
+    waypoints.append(Waypoint(
+        position=start,
+        estimated_arrival=departure_time.isoformat()
+    ))
     
-    for i in range(num_waypoints + 1):
-        fraction = i / num_waypoints
-        distance_from_start = total_distance * fraction
-        
-        # Calculate position
-        if i == 0:
-            position = start
-        elif i == num_waypoints:
-            position = end
-        else:
-            position = calculate_destination(start, distance_from_start, bearing)
+    for i in range(1, num_waypoints):
+        distance_from_start = total_distance * (i / num_waypoints)
+        position = calculate_destination(start, distance_from_start, bearing)
         
         # Calculate arrival time based on distance and speed
         hours_from_start = distance_from_start / avg_speed
-        arrival_time = departure_time + timedelta(hours=hours_from_start)
         
         waypoints.append(Waypoint(
             position=position,
-            estimated_arrival=arrival_time.isoformat()
+            estimated_arrival=(departure_time + timedelta(hours=hours_from_start)).isoformat()
         ))
     
+    waypoints.append(Waypoint(
+        position=end,
+        estimated_arrival=(departure_time + timedelta(hours=total_distance / avg_speed)).isoformat()
+    ))
+    
     return waypoints
 
 
+def calculate_offset_factors(num_waypoints: int) -> List[float]:
+    """
+    Sine profile used to bend curved routes away from the direct line.
+    
+    Depends only on num_waypoints, so generate_routes() computes it once and
+    shares it between the port and starboard routes.
+    
+    Returns:
+        num_waypoints + 1 factors from 0 (ends) to 1 (middle of route)
+    """
+    return [math.sin(i / num_waypoints * math.pi) for i in range(num_waypoints + 1)]
+
+
 def generate_curved_waypoints(
     start: Coordinates,
     end: Coordinates,
     num_waypoints: int,
     departure_time: datetime,
     avg_speed: float,
-    offset_direction: str,  # 'left' or 'right'
-    offset_amount: float    # nautical miles
+    offset_sign: int,       # -1 = left (port), +1 = right (starboard)
+    offset_amount: float,   # nautical miles
+    offset_factors: Optional[List[float]] = None,
+    total_distance: Optional[float] = None,
+    main_bearing: Optional[float] = None
 ) -> List[Waypoint]:
     """
     Generate waypoints along a curved path (offset left or right of direct route).
@@ -180,72 +401,79 @@ def generate_curved_waypoints(
         num_waypoints: Number of intermediate points
         departure_time: When the journey starts
         avg_speed: Average boat speed in knots
-        offset_direction: 'left' (port) or 'right' (starboard)
+        offset_sign: -1 for left (port), +1 for right (starboard)
         offset_amount: Maximum offset distance in nautical miles
+        offset_factors: Precomputed sine profile from calculate_offset_factors()
+                        (computed here if not provided)
+        total_distance: Precomputed start-to-end distance (computed if not provided)
+        main_bearing: Precomputed start-to-end bearing (computed if not provided)
         
     Returns:
         List of waypoints forming a curved path
     """
     waypoints = []
-    total_distance = calculate_distance(start, end)
-    main_bearing = calculate_bearing(start, end)
+    if total_distance is None and main_bearing is None:
+        total_distance, main_bearing = calculate_distance_and_bearing(start, end)
+    elif total_distance is None:
+        total_distance = calculate_distance(start, end)
+    elif main_bearing is None:
+        main_bearing = calculate_bearing(start, end)
     
     # Calculate perpendicular bearing for offset
     # Left (port) = -90 degrees from travel direction
     # Right (starboard) = +90 degrees from travel direction
-    if offset_direction == 'left':
-        perp_bearing = (main_bearing - 90 + 360) % 360
-    else:
-        perp_bearing = (main_bearing + 90) % 360
+    perp_bearing = (main_bearing + offset_sign * 90.0) % 360.0
     
-    cumulative_distance = 0.0
-    prev_position = None
+    if offset_factors is None:
+        offset_factors = calculate_offset_factors(num_waypoints)
     
-    for i in range(num_waypoints + 1):
-        fraction = i / num_waypoints
-        
-        # Create a sine curve for smooth offset (maximum at middle of route)
-        offset_factor = math.sin(fraction * math.pi)
-        current_offset = offset_amount * offset_factor
-        
-        # Get position
-        if i == 0:
-            position = start
-        elif i == num_waypoints:
-            position = end
-        else:
-            # First, find point on direct line
-            distance_from_start = total_distance * fraction
-            direct_point = calculate_destination(start, distance_from_start, main_bearing)
-            # Then offset it perpendicular to the route
-            position = calculate_destination(direct_point, current_offset, perp_bearing)
+    # Start and end are fixed, so only the intermediate points need computing
+    waypoints.append(Waypoint(
+        position=start,
+        estimated_arrival=departure_time.isoformat()
+    ))
+    cumulative_distance = 0.0
+    prev_position = start
+    
+    for i in range(1, num_waypoints):
+        # First, find point on direct line
+        distance_from_start = total_distance * (i / num_waypoints)
+        direct_point = calculate_destination(start, distance_from_start, main_bearing)
+        # Then offset it perpendicular to the route (sine curve, maximum at middle)
+        position = calculate_destination(
+            direct_point, offset_amount * offset_factors[i], perp_bearing
+        )
         
         # Calculate cumulative distance (for accurate time estimates)
-        if prev_position is not None:
-            cumulative_distance += calculate_distance(prev_position, position)
-        
-        hours_from_start = cumulative_distance / avg_speed
-        arrival_time = departure_time + timedelta(hours=hours_from_start)
+        cumulative_distance += calculate_distance(prev_position, position)
         
         waypoints.append(Waypoint(
             position=position,
-            estimated_arrival=arrival_time.isoformat()
+            estimated_arrival=(departure_time + timedelta(hours=cumulative_distance / avg_speed)).isoformat()
         ))
         
         prev_position = position
     
+    cumulative_distance += calculate_distance(prev_position, end)
+    waypoints.append(Waypoint(
+        position=end,
+        estimated_arrival=(departure_time + timedelta(hours=cumulative_distance / avg_speed)).isoformat()
+    ))
+    
     return waypoints
 
 
+def calculate_segment_distances(waypoints: List[Waypoint]) -> List[float]:
+    """Calculate the distance of each segment between consecutive waypoints."""
+    return [
+        calculate_distance(prev.position, curr.position)
+        for prev, curr in zip(waypoints, waypoints[1:])
+    ]
+
+
 def calculate_route_distance(waypoints: List[Waypoint]) -> float:
     """Calculate total distance of a route by summing segment distances."""
-    total = 0.0
-    for i in range(1, len(waypoints)):
-        total += calculate_distance(
-            waypoints[i - 1].position, 
-            waypoints[i].position
-        )
-    return total
+    return sum(calculate_segment_distances(waypoints))
 
 
 def format_duration(hours: float) -> str:
@@ -271,6 +499,11 @@ class GeneratedRoute:
     distance: float
     estimated_hours: float
     estimated_time: str
+    # Per-segment distances (nm), cached by generate_routes() so time recalculation
+    # can reuse them; initial bearings (degrees) are filled in by
+    # recalculate_route_times_with_wind() so scoring can reuse them
+    segment_distances: Optional[List[float]] = None
+    segment_headings: Optional[List[float]] = None
 
 
 def generate_routes(request: RouteRequest) -> List[GeneratedRoute]:
@@ -291,22 +524,27 @@ def generate_routes(request: RouteRequest) -> List[GeneratedRoute]:
     start = request.start
     end = request.end
     boat = BOAT_PROFILES[request.boat_type]
-    departure = datetime.fromisoformat(request.departure_time.replace('Z', '+00:00'))
+    avg_speed = boat.avg_speed
+    departure = parse_departure_time(request.departure_time)
     num_waypoints = 5  # Creates 6 total points including start/end
     
     direct_distance = calculate_distance(start, end)
+    main_bearing = calculate_bearing(start, end)
     
     # Offset scales with distance (5% of distance, min 10nm, max 50nm)
     offset_amount = min(50, max(10, direct_distance * 0.05))
+    offset_factors = calculate_offset_factors(num_waypoints)
     
     routes = []
     
     # 1. Direct Route
     direct_waypoints = generate_direct_waypoints(
-        start, end, num_waypoints, departure, boat.avg_speed
+        start, end, num_waypoints, departure, avg_speed,
+        total_distance=direct_distance, main_bearing=main_bearing
     )
-    direct_route_distance = calculate_route_distance(direct_waypoints)
-    direct_hours = direct_route_distance / boat.avg_speed
+    direct_segments = calculate_segment_distances(direct_waypoints)
+    direct_route_distance = sum(direct_segments)
+    direct_hours = direct_route_distance / avg_speed
     
     routes.append(GeneratedRoute(
         name="Direct Route",
@@ -314,15 +552,18 @@ def generate_routes(request: RouteRequest) -> List[GeneratedRoute]:
         waypoints=direct_waypoints,
         distance=round(direct_route_distance, 1),
         estimated_hours=direct_hours,
-        estimated_time=format_duration(direct_hours)
+        estimated_time=format_duration(direct_hours),
+        segment_distances=direct_segments
     ))
     
     # 2. Port Route (curves left of direct route)
     port_waypoints = generate_curved_waypoints(
-        start, end, num_waypoints, departure, boat.avg_speed, 'left', offset_amount
+        start, end, num_waypoints, departure, avg_speed, -1, offset_amount, offset_factors,
+        total_distance=direct_distance, main_bearing=main_bearing
     )
-    port_distance = calculate_route_distance(port_waypoints)
-    port_hours = port_distance / boat.avg_speed
+    port_segments = calculate_segment_distances(port_waypoints)
+    port_distance = sum(port_segments)
+    port_hours = port_distance / avg_speed
     
     routes.append(GeneratedRoute(
         name="Port Route",
@@ -330,15 +571,18 @@ def generate_routes(request: RouteRequest) -> List[GeneratedRoute]:
         waypoints=port_waypoints,
         distance=round(port_distance, 1),
         estimated_hours=port_hours,
-        estimated_time=format_duration(port_hours)
+        estimated_time=format_duration(port_hours),
+        segment_distances=port_segments
     ))
     
     # 3. Starboard Route (curves right of direct route)
     starboard_waypoints = generate_curved_waypoints(
-        start, end, num_waypoints, departure, boat.avg_speed, 'right', offset_amount
+        start, end, num_waypoints, departure, avg_speed, +1, offset_amount, offset_factors,
+        total_distance=direct_distance, main_bearing=main_bearing
     )
-    starboard_distance = calculate_route_distance(starboard_waypoints)
-    starboard_hours = starboard_distance / boat.avg_speed
+    starboard_segments = calculate_segment_distances(starboard_waypoints)
+    starboard_distance = sum(starboard_segments)
+    starboard_hours = starboard_distance / avg_speed
     
     routes.append(GeneratedRoute(
         name="Starboard Route",
@@ -346,7 +590,8 @@ def generate_routes(request: RouteRequest) -> List[GeneratedRoute]:
         waypoints=starboard_waypoints,
         distance=round(starboard_distance, 1),
         estimated_hours=starboard_hours,
-        estimated_time=format_duration(starboard_hours)
+        estimated_time=format_duration(starboard_hours),
+        segment_distances=starboard_segments
     ))
     
     return routes
@@ -372,66 +617,78 @@ def recalculate_route_times_with_wind(
     Returns:
         Updated route with recalculated times and total estimated_hours
     """
-    from polars import get_boat_speed, calculate_wind_angle
-    
     if not route.waypoints or len(route.waypoints) < 2:
         return route
     
     boat = BOAT_PROFILES[boat_type]
-    updated_waypoints = []
-    current_time = departure_time
-    
-    for i, waypoint in enumerate(route.waypoints):
-        if i == 0:
-            # First waypoint - use departure time
-            updated_waypoints.append(Waypoint(
-                position=waypoint.position,
-                estimated_arrival=current_time.isoformat(),
-                weather=waypoint.weather
-            ))
-            continue
-        
-        # Calculate segment from previous waypoint to current
-        prev_waypoint = route.waypoints[i - 1]
-        segment_distance = calculate_distance(prev_waypoint.position, waypoint.position)
-        heading = calculate_bearing(prev_waypoint.position, waypoint.position)
-        
+    boat_type_value = boat_type.value
+    avg_speed = boat.avg_speed
+    penalty_speed = avg_speed * 0.2  # 20% of average speed as penalty
+    waypoints = route.waypoints
+    
+    # First waypoint - use departure time
+    updated_waypoints = [Waypoint(
+        position=waypoints[0].position,
+        estimated_arrival=departure_time.isoformat(),
+        weather=waypoints[0].weather
+    )]
+    total_time_hours = 0.0
+    
+    # Reuse segment distances (and headings, if a previous pass cached them) when
+    # they still match, otherwise compute distance and heading together for every segment
+    num_segments = len(waypoints) - 1
+    segment_distances = route.segment_distances
+    segment_headings = route.segment_headings
+    if segment_headings is not None and len(segment_headings) != num_segments:
+        segment_headings = None
+    if segment_distances is None or len(segment_distances) != num_segments:
+        legs = [
+            calculate_distance_and_bearing(prev.position, curr.position)
+            for prev, curr in zip(waypoints, waypoints[1:])
+        ]
+        segment_distances = [distance for distance, _ in legs]
+        segment_headings = [heading for _, heading in legs]
+    # Headings computed on demand below, kept for scoring if every segment needed one
+    computed_headings = [] if segment_headings is None else None
+    
+    # Single pass over consecutive (previous, current) waypoint pairs
+    for i, (prev_waypoint, waypoint, segment_distance) in enumerate(zip(
+        waypoints, waypoints[1:], segment_distances
+    )):
         # Get wind conditions at previous waypoint (where we start this segment)
-        if prev_waypoint.weather:
-            wind_speed = prev_waypoint.weather.wind_speed
-            wind_direction = prev_waypoint.weather.wind_direction
+        prev_weather = prev_waypoint.weather
+        if prev_weather:
+            if segment_headings is not None:
+                heading = segment_headings[i]
+            else:
+                heading = calculate_bearing(prev_waypoint.position, waypoint.position)
+                computed_headings.append(heading)
             
             # Calculate wind angle relative to our heading
-            wind_angle = calculate_wind_angle(heading, wind_direction)
+            wind_angle = calculate_wind_angle(heading, prev_weather.wind_direction)
             
             # Get actual boat speed from polars (accounts for wind angle, including no-go zones)
-            boat_speed = get_boat_speed(wind_speed, wind_angle, boat_type.value)
+            boat_speed = get_boat_speed(prev_weather.wind_speed, wind_angle, boat_type_value)
             
             # If in no-go zone (speed = 0) or very slow, use a minimum penalty speed
             # This represents very slow progress (motoring, or extreme tacking)
             if boat_speed < 1.0:
-                boat_speed = boat.avg_speed * 0.2  # 20% of average speed as penalty
+                boat_speed = penalty_speed
         else:
             # No weather data, use average speed
-            boat_speed = boat.avg_speed
-        
-        # Calculate time for this segment
-        if boat_speed > 0:
-            segment_hours = segment_distance / boat_speed
-        else:
-            # Fallback: use average speed
-            segment_hours = segment_distance / boat.avg_speed
+            boat_speed = avg_speed
         
-        current_time = current_time + timedelta(hours=segment_hours)
+        # Accumulate hours as a float and convert to a datetime once per waypoint
+        total_time_hours += segment_distance / (boat_speed if boat_speed > 0 else avg_speed)
         
         updated_waypoints.append(Waypoint(
             position=waypoint.position,
-            estimated_arrival=current_time.isoformat(),
+            estimated_arrival=(departure_time + timedelta(hours=total_time_hours)).isoformat(),
             weather=waypoint.weather
         ))
     
-    # Calculate total time
-    total_time_hours = (current_time - departure_time).total_seconds() / 3600
+    if computed_headings is not None and len(computed_headings) == len(segment_distances):
+        segment_headings = computed_headings
     
     # Return updated route
     return GeneratedRoute(
@@ -440,5 +697,7 @@ def recalculate_route_times_with_wind(
         waypoints=updated_waypoints,
         distance=route.distance,  # Distance doesn't change
         estimated_hours=total_time_hours,
-        estimated_time=format_duration(total_time_hours)
+        estimated_time=format_duration(total_time_hours),
+        segment_distances=segment_distances,
+        segment_headings=segment_headings
     )
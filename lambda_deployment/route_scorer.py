@@ -9,18 +9,41 @@ Scoring is based on:
 """
 
 import logging
-from typing import List, Tuple
-from models import (
-    Waypoint, Route, BoatProfile, BoatType, 
-    BOAT_PROFILES, WaypointWeather, RouteType
-)
+from itertools import repeat
+from typing import List, Optional, Tuple
+from models import Waypoint, Route, BoatType, BOAT_PROFILES, RouteType
 from route_generator import GeneratedRoute, calculate_bearing
-from weather_fetcher import summarize_weather
 from polars import is_in_no_go_zone, calculate_wind_angle as calculate_wind_angle_polar
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Boat types whose score depends on the wind angle
+_SAIL_TYPES = frozenset({BoatType.SAILBOAT, BoatType.CATAMARAN})
+
+# Thresholds crossed by a waypoint, returned by the score_*_conditions functions.
+# Scoring runs for every waypoint, so it reports bits and score_route only
+# formats text for the few conditions that end up as route warnings.
+FLAG_LOW_WIND = 1 << 0
+FLAG_CLOSE_TO_WIND = 1 << 1
+FLAG_GOOD_SAILING_ANGLE = 1 << 2
+FLAG_DANGEROUS_WIND = 1 << 3
+FLAG_STRONG_WIND = 1 << 4
+FLAG_DANGEROUS_WAVES = 1 << 5
+FLAG_ROUGH_SEAS = 1 << 6
+FLAG_CALM_SEAS = 1 << 7
+FLAG_POOR_VISIBILITY = 1 << 8
+FLAG_REDUCED_VISIBILITY = 1 << 9
+FLAG_HEAVY_RAIN = 1 << 10
+FLAG_RAIN = 1 << 11
+
+# Warning text for flags that are reported as route warnings, formatted with
+# the waypoint reading that triggered them
+_FLAG_MESSAGES = {
+    FLAG_DANGEROUS_WIND: "Dangerous wind: {}kt exceeds safe limit",
+    FLAG_DANGEROUS_WAVES: "Dangerous waves: {}m exceeds safe limit",
+}
+
 
 # NOTE: Using calculate_wind_angle from polars.py instead
 # The function below was calculating opposite values and causing bugs
@@ -34,27 +57,38 @@ logger = logging.getLogger(__name__)
 
 
 def score_wind_conditions(
-    weather: WaypointWeather,
-    boat_heading: float,
-    boat: BoatProfile
-) -> Tuple[float, List[str]]:
+    wind_speed: float,
+    wind_angle: float,
+    is_sail: bool,
+    min_wind_speed: float,
+    max_safe_wind_speed: float
+) -> Tuple[float, int]:
     """
     Score wind conditions for a route segment.
     
+    Boat profile values are passed as plain floats so score_route can read
+    them once per route instead of once per waypoint.
+    
+    Args:
+        wind_speed: Wind speed at the start of the segment (knots)
+        wind_angle: True wind angle for the segment heading (0-180°), as
+                    computed by calculate_wind_angle from polars.py
+        is_sail: True for boats whose speed depends on the wind angle
+        min_wind_speed: Boat's minimum wind speed for sailing (knots)
+        max_safe_wind_speed: Boat's safe wind limit (knots)
+    
     Returns:
-        Tuple of (score 0-100, list of notes)
+        Tuple of (score 0-100, FLAG_* bits for the thresholds crossed)
     """
-    notes = []
+    flags = 0
     score = 100.0
     
-    wind_angle = calculate_wind_angle_polar(boat_heading, weather.wind_direction)
-    
     # For sailboats, wind angle matters a lot
-    if boat.boat_type in [BoatType.SAILBOAT, BoatType.CATAMARAN]:
+    if is_sail:
         # Too little wind = bad for sailing
-        if weather.wind_speed < boat.min_wind_speed:
+        if wind_speed < min_wind_speed:
             score -= 30
-            notes.append(f"Low wind ({weather.wind_speed}kt) - may need motor")
+            flags |= FLAG_LOW_WIND
         
         # NO-GO ZONE: Heading into wind = boat can't sail efficiently or at all
         if wind_angle < 45:
@@ -62,64 +96,67 @@ def score_wind_conditions(
             # Note: NO-GO zone warnings now handled in frontend visualization, not here
         elif wind_angle < 60:
             score -= 50  # Still very poor sailing angle
-            notes.append(f"Very close to wind ({wind_angle:.0f}°) - poor performance")
+            flags |= FLAG_CLOSE_TO_WIND
         # Beam reach to broad reach = ideal for sailing
         elif 90 <= wind_angle <= 150:
             score += 10  # bonus!
-            notes.append(f"Good sailing angle ({wind_angle:.0f}°)")
+            flags |= FLAG_GOOD_SAILING_ANGLE
     
     # High wind is dangerous for all boats
-    if weather.wind_speed > boat.max_safe_wind_speed:
+    if wind_speed > max_safe_wind_speed:
         score -= 40
-        notes.append(f"Dangerous wind: {weather.wind_speed}kt exceeds safe limit")
-    elif weather.wind_speed > boat.max_safe_wind_speed * 0.8:
+        flags |= FLAG_DANGEROUS_WIND
+    elif wind_speed > max_safe_wind_speed * 0.8:
         score -= 20
-        notes.append(f"Strong wind: {weather.wind_speed}kt - challenging conditions")
+        flags |= FLAG_STRONG_WIND
     
-    return max(0, min(100, score)), notes
+    return max(0, min(100, score)), flags
 
 
 def score_wave_conditions(
     wave_height: float,
-    boat: BoatProfile
-) -> Tuple[float, List[str]]:
-    """Score wave conditions."""
-    notes = []
+    max_safe_wave_height: float
+) -> Tuple[float, int]:
+    """Score wave conditions. Returns (score 0-100, FLAG_* bits)."""
+    flags = 0
     score = 100.0
     
-    if wave_height > boat.max_safe_wave_height:
+    if wave_height > max_safe_wave_height:
         score -= 40
-        notes.append(f"Dangerous waves: {wave_height}m exceeds safe limit")
-    elif wave_height > boat.max_safe_wave_height * 0.7:
+        flags |= FLAG_DANGEROUS_WAVES
+    elif wave_height > max_safe_wave_height * 0.7:
         score -= 20
-        notes.append(f"Rough seas: {wave_height}m waves")
+        flags |= FLAG_ROUGH_SEAS
     elif wave_height < 0.5:
         score += 5
-        notes.append("Calm seas")
+        flags |= FLAG_CALM_SEAS
     
-    return max(0, min(100, score)), notes
+    return max(0, min(100, score)), flags
 
 
-def score_visibility_conditions(weather: WaypointWeather) -> Tuple[float, List[str]]:
-    """Score visibility and precipitation."""
-    notes = []
+def score_visibility_conditions(
+    visibility: float,
+    precipitation: float
+) -> Tuple[float, int]:
+    """Score visibility and precipitation. Returns (score 0-100, FLAG_* bits)."""
+    flags = 0
     score = 100.0
     
-    if weather.visibility < 2:
+    if visibility < 2:
         score -= 30
-        notes.append("Poor visibility - fog or heavy precipitation")
-    elif weather.visibility < 5:
+        flags |= FLAG_POOR_VISIBILITY
+    elif visibility < 5:
         score -= 15
-        notes.append("Reduced visibility")
+        flags |= FLAG_REDUCED_VISIBILITY
     
-    if weather.precipitation > 5:
+    if precipitation > 5:
         score -= 20
-        notes.append("Heavy rain expected")
-    elif weather.precipitation > 1:
+        flags |= FLAG_HEAVY_RAIN
+    elif precipitation > 1:
         score -= 10
-        notes.append("Rain expected")
+        flags |= FLAG_RAIN
     
-    return max(0, min(100, score)), notes
+    return max(0, min(100, score)), flags
 
 
 def score_distance(
@@ -147,35 +184,39 @@ def score_distance(
     return score, notes
 
 
-def calculate_segment_bearings(waypoints: List[Waypoint]) -> List[float]:
+def calculate_segment_bearings(
+    waypoints: List[Waypoint],
+    segment_headings: Optional[List[float]] = None
+) -> List[float]:
     """
     Get heading for each segment of the route.
     
     For segment FROM waypoint[i] TO waypoint[i+1]:
     - Prefer heading stored at waypoint[i+1] (represents the leg arriving at i+1)
-    - Fall back to calculating bearing between positions
+    - Fall back to segment_headings[i] if provided (GeneratedRoute.segment_headings)
+    - Otherwise calculate bearing between positions
     
     This ensures we're checking the correct heading for each segment.
     """
-    bearings = []
-    for i in range(len(waypoints)):
-        if i < len(waypoints) - 1:
-            # Not the last waypoint - check segment to next waypoint
-            next_wp = waypoints[i + 1]
-            
-            # Use the heading stored at the NEXT waypoint (represents this segment)
-            if next_wp.heading is not None:
-                bearings.append(next_wp.heading)
-            else:
-                # Fallback: calculate bearing from current to next waypoint
-                bearing = calculate_bearing(
-                    waypoints[i].position,
-                    next_wp.position
-                )
-                bearings.append(bearing)
-        else:
-            # Last waypoint has no next segment, use 0 as default
-            bearings.append(0)
+    if segment_headings is not None and len(segment_headings) != len(waypoints) - 1:
+        segment_headings = None
+    
+    if segment_headings is None:
+        bearings = [
+            # Use the heading stored at the NEXT waypoint (represents this segment),
+            # falling back to the bearing from current to next waypoint
+            next_wp.heading if next_wp.heading is not None
+            else calculate_bearing(wp.position, next_wp.position)
+            for wp, next_wp in zip(waypoints, waypoints[1:])
+        ]
+    else:
+        bearings = [
+            next_wp.heading if next_wp.heading is not None else cached
+            for next_wp, cached in zip(waypoints[1:], segment_headings)
+        ]
+    if waypoints:
+        # Last waypoint has no next segment, use 0 as default
+        bearings.append(0)
     return bearings
 
 
@@ -204,9 +245,24 @@ def score_route(
         Complete Route object with score, warnings, pros, cons
     """
     boat = BOAT_PROFILES[boat_type]
-    bearings = calculate_segment_bearings(route.waypoints)
+    boat_type_value = boat.boat_type.value
+    is_sail = boat.boat_type in _SAIL_TYPES
+    min_wind = boat.min_wind_speed
+    max_wind = boat.max_safe_wind_speed
+    max_wave = boat.max_safe_wave_height
+    
+    # Only sailing boats care about the wind angle (no-go zone, angle penalties),
+    # so motorboat routes skip the bearing and wind angle work entirely
+    # One heading per waypoint (the last one reuses the 0 default), so the loop
+    # can zip headings with waypoints instead of indexing
+    bearings = (
+        calculate_segment_bearings(route.waypoints, route.segment_headings) if is_sail
+        else repeat(0)
+    )
     
-    all_warnings = []
+    # Distinct (flag, reading) pairs for serious conditions, in first-seen order
+    severe_readings = []
+    severe_seen = set()
     all_pros = []
     all_cons = []
     
@@ -226,61 +282,92 @@ def score_route(
     danger_penalty = 0
     dangerous_waypoints = 0
     
+    # Weather summary accumulated in the same pass (see summarize_weather)
+    sum_wind_speed = 0.0
+    sum_wave_height = 0.0
+    max_wave_height = None
+    sum_visibility = 0.0
+    has_rain = False
+    
     # Score each waypoint/segment
-    for i, waypoint in enumerate(route.waypoints):
-        if waypoint.weather is None:
+    for waypoint, heading in zip(route.waypoints, bearings):
+        weather = waypoint.weather
+        if weather is None:
             continue
         
-        # Check if this is estimated (default) weather data
-        if waypoint.weather.is_estimated:
-            estimated_weather_count += 1
-        
-        # Use bearing of the segment starting at this waypoint
-        heading = bearings[min(i, len(bearings) - 1)] if bearings else 0
+        # Read each weather field once per waypoint instead of re-walking
+        # waypoint.weather.<field> in every check below
+        wind_speed = weather.wind_speed
+        wave_height = weather.wave_height
+        visibility = weather.visibility
+        precipitation = weather.precipitation
         
-        # Calculate wind angle for no-go zone detection (use polars.py function!)
-        wind_angle = calculate_wind_angle_polar(heading, waypoint.weather.wind_direction)
+        sum_wind_speed += wind_speed
+        sum_wave_height += wave_height
+        if max_wave_height is None or wave_height > max_wave_height:
+            max_wave_height = wave_height
+        sum_visibility += visibility
+        if precipitation > 0.5:
+            has_rain = True
         
-        # DEBUG: Print wind angle info for sailboats/catamarans (disabled for cleaner output)
-        # if boat.boat_type in [BoatType.SAILBOAT, BoatType.CATAMARAN]:
-        #     print(f"      [DEBUG] WP{i}: heading={heading:.1f}°, wind_from={waypoint.weather.wind_direction:.1f}°, wind_angle={wind_angle:.1f}°")
+        # Check if this is estimated (default) weather data
+        if weather.is_estimated:
+            estimated_weather_count += 1
         
-        # Check if sailing in NO-GO ZONE (can't sail into wind)
-        if is_in_no_go_zone(wind_angle, boat.boat_type.value):
-            no_go_waypoints += 1
-            # Very light penalty - only count waypoints for now
-            # print(f"      [NO-GO ZONE] Wind angle: {wind_angle:.0f}°, Total waypoints: {no_go_waypoints}")
+        if is_sail:
+            # Calculate wind angle for the segment starting at this waypoint,
+            # used for no-go zone detection (use polars.py function!)
+            wind_angle = calculate_wind_angle_polar(heading, weather.wind_direction)
+            
+            # DEBUG: Print wind angle info (disabled for cleaner output)
+            # print(f"      [DEBUG] heading={heading:.1f}°, wind_from={weather.wind_direction:.1f}°, wind_angle={wind_angle:.1f}°")
+            
+            # Check if sailing in NO-GO ZONE (can't sail into wind)
+            if is_in_no_go_zone(wind_angle, boat_type_value):
+                no_go_waypoints += 1
+                # Very light penalty - only count waypoints for now
+                # print(f"      [NO-GO ZONE] Wind angle: {wind_angle:.0f}°, Total waypoints: {no_go_waypoints}")
+        else:
+            # Unused by score_wind_conditions when is_sail is False
+            wind_angle = 0.0
         
         # Wind scoring
-        wind_score, wind_notes = score_wind_conditions(
-            waypoint.weather, heading, boat
+        wind_score, wind_flags = score_wind_conditions(
+            wind_speed, wind_angle, is_sail, min_wind, max_wind
         )
         total_wind_score += wind_score
         
         # Wave scoring
-        wave_score, wave_notes = score_wave_conditions(
-            waypoint.weather.wave_height, boat
+        wave_score, wave_flags = score_wave_conditions(
+            wave_height, max_wave
         )
         total_wave_score += wave_score
         
         # Visibility scoring
-        vis_score, vis_notes = score_visibility_conditions(waypoint.weather)
+        vis_score, _ = score_visibility_conditions(visibility, precipitation)
         total_visibility_score += vis_score
         
         # Collect warnings (only unique, serious ones)
-        for note in wind_notes + wave_notes + vis_notes:
-            if ('Dangerous' in note or 'exceeds' in note or 'NO-GO' in note) and note not in all_warnings:
-                all_warnings.append(note)
+        if wind_flags & FLAG_DANGEROUS_WIND:
+            reading = (FLAG_DANGEROUS_WIND, wind_speed)
+            if reading not in severe_seen:
+                severe_seen.add(reading)
+                severe_readings.append(reading)
+        if wave_flags & FLAG_DANGEROUS_WAVES:
+            reading = (FLAG_DANGEROUS_WAVES, wave_height)
+            if reading not in severe_seen:
+                severe_seen.add(reading)
+                severe_readings.append(reading)
         
         # Also check for dangerous conditions (high wind/waves/poor visibility)
         is_dangerous = False
-        if waypoint.weather.wind_speed > boat.max_safe_wind_speed:
+        if wind_speed > max_wind:
             is_dangerous = True
             danger_penalty += 80  # MASSIVE penalty - route should be disqualified
-        if waypoint.weather.wave_height > boat.max_safe_wave_height:
+        if wave_height > max_wave:
             is_dangerous = True
             danger_penalty += 70  # MASSIVE penalty - route should be disqualified
-        if waypoint.weather.visibility < 1:  # Very poor visibility
+        if visibility < 1:  # Very poor visibility
             is_dangerous = True
             danger_penalty += 40  # Heavy penalty
         
@@ -289,6 +376,8 @@ def score_route(
         
         segments_scored += 1
     
+    all_warnings = [_FLAG_MESSAGES[flag].format(value) for flag, value in severe_readings]
+    
     # Distance scoring
     distance_score, distance_notes = score_distance(route.distance, direct_distance)
     
@@ -313,10 +402,15 @@ def score_route(
         no_go_penalty = 0  # No penalty for routes with few no-go waypoints
     
     # Apply penalties
-    logger.debug(f"   [SCORING] Base score: {final_score}, No-go waypoints: {no_go_waypoints}, No-go penalty: {no_go_penalty}, Danger penalty: {danger_penalty}")
+    # Lazy %-style args: score_route runs for every candidate route and these
+    # messages are only formatted when debug logging is enabled
+    logger.debug(
+        "   [SCORING] Base score: %s, No-go waypoints: %s, No-go penalty: %s, Danger penalty: %s",
+        final_score, no_go_waypoints, no_go_penalty, danger_penalty
+    )
     final_score -= no_go_penalty
     final_score -= danger_penalty
-    logger.debug(f"   [SCORING] Final score after penalties: {final_score}")
+    logger.debug("   [SCORING] Final score after penalties: %s", final_score)
     
     # Add warning if route has many no-go zone waypoints
     if no_go_waypoints > 5:
@@ -333,26 +427,36 @@ def score_route(
         all_cons.append(f"Passes through dangerous conditions ({dangerous_waypoints} waypoints)")
     
     # Generate pros and cons based on weather summary
-    weather_summary = summarize_weather(route.waypoints)
+    # (same values summarize_weather() would return for these waypoints)
+    if segments_scored > 0:
+        avg_wind_speed = round(sum_wind_speed / segments_scored, 1)
+        avg_wave_height = round(sum_wave_height / segments_scored, 1)
+        max_wave_height = round(max_wave_height, 1)
+        avg_visibility = round(sum_visibility / segments_scored)
+    else:
+        avg_wind_speed = 0
+        avg_wave_height = 0
+        max_wave_height = 0
+        avg_visibility = 10
     
     # Determine pros
-    if 8 <= weather_summary['avg_wind_speed'] <= 20:
+    if 8 <= avg_wind_speed <= 20:
         all_pros.append("Good sailing wind")
-    if weather_summary['avg_wave_height'] < 1:
+    if avg_wave_height < 1:
         all_pros.append("Calm seas")
-    if not weather_summary['has_rain']:
+    if not has_rain:
         all_pros.append("No rain expected")
     if route.route_type == RouteType.DIRECT:
         all_pros.append("Shortest distance")
-    if weather_summary['avg_visibility'] > 15:
+    if avg_visibility > 15:
         all_pros.append("Excellent visibility")
     
     # Determine cons
-    if weather_summary['avg_wind_speed'] < 5 and boat.boat_type == BoatType.SAILBOAT:
+    if avg_wind_speed < 5 and boat.boat_type == BoatType.SAILBOAT:
         all_cons.append("May need motor - low wind")
-    if weather_summary['max_wave_height'] > 2:
+    if max_wave_height > 2:
         all_cons.append("Rough sections expected")
-    if weather_summary['has_rain']:
+    if has_rain:
         all_cons.append("Rain expected on route")
     if route.distance > direct_distance * 1.1:
         all_cons.append("Longer route")
@@ -382,3 +486,23 @@ def score_route(
         cons=all_cons
     )
 
+
+def score_routes(
+    routes: List[GeneratedRoute],
+    boat_type: BoatType,
+    direct_distance: float
+) -> List[Route]:
+    """
+    Score all candidate routes for one request.
+    
+    Args:
+        routes: Generated routes with waypoints and weather
+        boat_type: Type of boat
+        direct_distance: Distance of direct route (for comparison)
+        
+    Returns:
+        Scored routes sorted by score (highest first)
+    """
+    scored_routes = [score_route(route, boat_type, direct_distance) for route in routes]
+    scored_routes.sort(key=lambda r: r.score, reverse=True)
+    return scored_routes